@@ -1,29 +1,56 @@
+import functools
 import json
 import logging
-from typing import Dict, List, Any, Optional, Union, cast, TypedDict
-import threading
-import time
+import os
+import re
+import uuid
+from typing import AsyncIterator, Dict, List, Any, Optional, Tuple, TypedDict
 import asyncio
+import concurrent.futures
+import litellm
 from crewai.utilities.events import crewai_event_bus
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    # orjson not installed; fall back to the stdlib parser
+    _json_loads = json.loads
+
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
+logger = logging.getLogger(__name__)
 
+# Maximum number of chat LLM calls allowed in flight at once across all handlers
+LLM_CONCURRENCY_LIMIT = 8
+_llm_executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=LLM_CONCURRENCY_LIMIT, thread_name_prefix="chat-llm"
+)
+# Streamed calls run on the event loop rather than the pool, so bound them separately
+_llm_stream_slots = asyncio.Semaphore(LLM_CONCURRENCY_LIMIT)
+
+# Number of most recent messages kept verbatim per user/assistant turn pair
+MAX_HISTORY_TURNS = 20
+# Older messages are folded into a single system message with this prefix
+SUMMARY_PREFIX = "Prior conversation summary: "
+MAX_SUMMARY_CHARS = 2000
+
+# Prompt for the follow-up call that turns tool output into a reply
+SUMMARY_INSTRUCTION = (
+    "Briefly summarize the tool results for the user, answering their request."
+)
 
-# Define message types for better type checking
-class ToolCall(TypedDict):
-    id: str
-    function: Dict[str, Any]
+# Characters OpenAI doesn't allow in function names ('^[a-zA-Z0-9_-]+$')
+_NAME_RE = re.compile(r"[^a-zA-Z0-9_-]")
 
 
-class AssistantMessageWithToolCalls(TypedDict):
-    role: str
-    content: Optional[str]
-    tool_calls: List[ToolCall]
+@functools.lru_cache(maxsize=32)
+def _sanitize_function_name(name: str) -> str:
+    """Replace characters that aren't allowed in function names with underscores."""
+    return _NAME_RE.sub("_", name)
 
 
+# Define message types for better type checking
 class Message(TypedDict):
     role: str
     content: str
@@ -39,6 +66,15 @@ from crewai.cli.crew_chat import (
     build_system_message,
     run_crew_tool,
 )
+from crewai_chat_ui.event_listener import crew_visualization_listener, short_description
+from crewai_chat_ui.json_cache import CACHE_DIR, JsonFileCache, cache_key
+
+# Chat inputs, tool schema, system prompt and introduction per crew fingerprint
+_chat_setup_cache = JsonFileCache(CACHE_DIR / "chat_setup.json", max_entries=32)
+
+# Opt-in cache of tool-less chat replies, keyed by the conversation so far
+RESPONSE_CACHE_ENV_VAR = "CREWAI_CHAT_RESPONSE_CACHE"
+_response_cache = JsonFileCache(CACHE_DIR / "responses.json", max_entries=256)
 
 
 class ChatHandler:
@@ -53,15 +89,26 @@ class ChatHandler:
         self.crew = crew
         self.crew_name = crew_name
         self.chat_llm = self._initialize_chat_llm()
-        self.messages: List[Dict[str, str]] = []
+        self.messages: List[Dict[str, Any]] = []
         self.crew_chat_inputs = None
         self.crew_tool_schema = None
+        # Tools payload and its hash, built once so every turn sends identical bytes
+        self._tools: List[Dict[str, Any]] = []
+        self._tools_hash = ""
+        # Name/description of each crew input, as returned by /api/initialize
+        self.required_inputs: List[Dict[str, str]] = []
         self.available_functions: Dict[str, Any] = {}
+        # Case-insensitive view of available_functions for tool-call lookups
+        self._available_functions_lower: Dict[str, Any] = {}
+        # Number of times the crew has run as a tool, used to spot side effects
+        self._crew_runs = 0
         self.is_initialized = False
+        # Returned again by initialize() once the handler is set up
+        self.introductory_message: Any = None
+        # Serializes turns that share this handler's message history
+        self.lock = asyncio.Lock()
 
         # Register event listeners
-        from crewai_chat_ui.event_listener import crew_visualization_listener
-
         crew_visualization_listener.setup_listeners(crewai_event_bus)
 
         # Register agents with visualization listener immediately
@@ -72,70 +119,65 @@ class ChatHandler:
         This allows the visualization to display agents before the crew starts running.
         """
         try:
-            from crewai_chat_ui.event_listener import crew_visualization_listener
-            import uuid
-
             # Get or create a crew ID
             if hasattr(self.crew, "id") and self.crew.id:
                 crew_id = str(self.crew.id)
-                logging.info(f"Using existing crew ID: {crew_id}")
+                logger.info("Using existing crew ID: %s", crew_id)
             else:
                 # Create a new ID if not available
                 crew_id = str(uuid.uuid4())
                 # Set it on the crew instance for consistency
                 self.crew.id = crew_id
-                logging.info(f"Created and set new crew ID: {crew_id}")
+                logger.info("Created and set new crew ID: %s", crew_id)
 
-            # Initialize crew state
-            crew_visualization_listener.crew_state = {
+            # Build the crew, agent and task states, then register them in one go
+            crew_state = {
                 "id": crew_id,
                 "name": self.crew_name,
                 "status": "initializing",
             }
 
-            # Register agents
+            agent_states = {}
             for agent in self.crew.agents:
                 agent_id = str(agent.id) if hasattr(agent, "id") else str(uuid.uuid4())
-                crew_visualization_listener.agent_states[agent_id] = {
+                agent_states[agent_id] = {
                     "id": agent_id,
                     "role": agent.role,
-                    "name": agent.name if hasattr(agent, "name") else agent.role,
+                    "name": getattr(agent, "name", agent.role),
                     "status": "initializing",
-                    "description": (
-                        agent.backstory[:100] + "..."
-                        if len(agent.backstory) > 100
-                        else agent.backstory
-                    ),
+                    "description": short_description(agent.backstory),
                 }
 
-            # Register tasks if available
-            if hasattr(self.crew, "tasks"):
-                for i, task in enumerate(self.crew.tasks):
-                    task_id = str(task.id) if hasattr(task, "id") else f"task_{i}"
+            task_states = {}
+            for i, task in enumerate(getattr(self.crew, "tasks", [])):
+                task_id = str(task.id) if hasattr(task, "id") else f"task_{i}"
 
-                    # Determine agent ID if the task has an associated agent object
-                    assigned_agent_id = (
-                        str(task.agent.id)
-                        if hasattr(task, "agent") and getattr(task, "agent", None) is not None and hasattr(task.agent, "id")
-                        else None
-                    )
+                # Determine agent ID if the task has an associated agent object
+                assigned_agent_id = (
+                    str(task.agent.id)
+                    if getattr(task, "agent", None) is not None and hasattr(task.agent, "id")
+                    else None
+                )
 
-                    crew_visualization_listener.task_states[task_id] = {
-                        "id": task_id,
-                        "description": task.description,
-                        "status": "pending",
-                        "agent_id": assigned_agent_id,
-                    }
+                task_states[task_id] = {
+                    "id": task_id,
+                    "description": task.description,
+                    "status": "pending",
+                    "agent_id": assigned_agent_id,
+                }
+
+            crew_visualization_listener.register_crew(crew_state, agent_states, task_states)
 
             # We don't need to broadcast updates here - the WebSocket connection will
             # send the current state when a client connects
 
-            logging.info(
-                f"Registered {len(self.crew.agents)} agents with visualization listener"
+            logger.info(
+                "Registered %d agents with visualization listener", len(self.crew.agents)
             )
         except Exception as e:
-            logging.error(
-                f"Error registering agents with visualization listener: {str(e)}",
+            logger.error(
+                "Error registering agents with visualization listener: %s",
+                e,
                 exc_info=True,
             )
 
@@ -164,66 +206,173 @@ class ChatHandler:
         if not tool_schema:
             return tool_schema
 
-        # Make a deep copy to avoid modifying the original schema
-        sanitized_schema = dict(tool_schema)
+        if "function" not in tool_schema or "name" not in tool_schema["function"]:
+            return tool_schema
+
+        # Replace any non-alphanumeric, non-underscore, non-hyphen characters with underscores
+        original_name = tool_schema["function"]["name"]
+        sanitized_name = _sanitize_function_name(original_name)
 
-        # Ensure function name only contains allowed characters
-        if "function" in sanitized_schema and "name" in sanitized_schema["function"]:
-            # Replace any non-alphanumeric, non-underscore, non-hyphen characters with underscores
-            import re
+        # Nothing to rewrite, so the schema can be used as-is
+        if sanitized_name == original_name:
+            return tool_schema
 
-            original_name = sanitized_schema["function"]["name"]
-            sanitized_name = re.sub(r"[^a-zA-Z0-9_-]", "_", original_name)
-            sanitized_schema["function"]["name"] = sanitized_name
+        # Only the nested function dict changes; copy it too so the original
+        # schema isn't mutated through the shared reference
+        return {
+            **tool_schema,
+            "function": {**tool_schema["function"], "name": sanitized_name},
+        }
 
-        return sanitized_schema
+    def _trim_messages(self) -> None:
+        """Cap the history sent to the LLM to the system prompt plus recent turns.
+
+        Messages that fall out of the window are folded into a single summary
+        system message (by truncation, without an extra LLM call) so the
+        per-turn payload stays bounded as the conversation grows.
+        """
+        window = 2 * MAX_HISTORY_TURNS
+        if len(self.messages) <= window + 1:
+            return
+
+        head: List[Dict[str, Any]] = []
+        rest = self.messages
+        if rest and rest[0].get("role") == "system":
+            head, rest = rest[:1], rest[1:]
+
+        # Pick up the summary left by a previous trim, if any
+        summary = ""
+        first_content = rest[0].get("content")
+        if (
+            rest[0].get("role") == "system"
+            and isinstance(first_content, str)
+            and first_content.startswith(SUMMARY_PREFIX)
+        ):
+            summary = first_content[len(SUMMARY_PREFIX) :]
+            rest = rest[1:]
+
+        # Don't start the window on a tool response whose tool call was dropped
+        cut = max(len(rest) - window, 0)
+        while cut < len(rest) and rest[cut].get("role") == "tool":
+            cut += 1
+        dropped, recent = rest[:cut], rest[cut:]
+        if not dropped:
+            return
+
+        dropped_lines = [
+            f"{message['role']}: {message['content'][:200]}"
+            for message in dropped
+            if message.get("role") in ("user", "assistant") and message.get("content")
+        ]
+        summary = "\n".join(filter(None, [summary, *dropped_lines]))[
+            -MAX_SUMMARY_CHARS:
+        ]
+
+        self.messages = [
+            *head,
+            {"role": "system", "content": SUMMARY_PREFIX + summary},
+            *recent,
+        ]
+
+    def _crew_fingerprint(self) -> str:
+        """Hash the parts of the crew that the chat setup is derived from."""
+        crew_parts = {
+            "crew_name": self.crew_name,
+            "model": getattr(self.chat_llm, "model", type(self.chat_llm).__name__),
+            "agents": [
+                [
+                    getattr(agent, "role", ""),
+                    getattr(agent, "goal", ""),
+                    getattr(agent, "backstory", ""),
+                ]
+                for agent in self.crew.agents
+            ],
+            "tasks": [
+                [
+                    getattr(task, "description", ""),
+                    getattr(task, "expected_output", ""),
+                ]
+                for task in getattr(self.crew, "tasks", [])
+            ],
+        }
+        return cache_key(crew_parts)
 
     def initialize(self):
-        """Initialize the chat handler by analyzing the crew and setting up schemas."""
+        """Initialize the chat handler by analyzing the crew and setting up schemas.
+
+        Returns:
+            The crew's introductory message; later calls return the same message
+        """
         if self.is_initialized:
-            return
+            return self.introductory_message
 
         # Indicate that the crew is being analyzed
-        logging.info("Analyzing crew and required inputs...")
-
-        # Start loading indicator in a separate thread
-        loading_complete = threading.Event()
-        loading_thread = threading.Thread(
-            target=self._show_loading, args=(loading_complete,)
-        )
-        loading_thread.daemon = True
-        loading_thread.start()
+        logger.info("Analyzing crew and required inputs...")
 
         try:
-            # Generate crew chat inputs
-            self.crew_chat_inputs = generate_crew_chat_inputs(
-                self.crew, self.crew_name, self.chat_llm
-            )
+            # Reuse the setup from a previous run if the crew hasn't changed
+            setup_key = self._crew_fingerprint()
+            cached_setup = _chat_setup_cache.get(setup_key)
+
+            if cached_setup:
+                logger.info("Using cached chat setup for crew '%s'", self.crew_name)
+                self.crew_chat_inputs = ChatInputs.model_validate(
+                    cached_setup["crew_chat_inputs"]
+                )
+                crew_tool_schema = cached_setup["crew_tool_schema"]
+                system_message = cached_setup["system_message"]
+                introductory_message = cached_setup["introductory_message"]
+            else:
+                # Generate crew chat inputs
+                self.crew_chat_inputs = generate_crew_chat_inputs(
+                    self.crew, self.crew_name, self.chat_llm
+                )
 
-            # Generate tool schema
-            crew_tool_schema = generate_crew_tool_schema(self.crew_chat_inputs)
-            # Sanitize tool schema to ensure valid function names
-            self.crew_tool_schema = self._sanitize_tool_schema(crew_tool_schema)
+                # Generate tool schema
+                crew_tool_schema = generate_crew_tool_schema(self.crew_chat_inputs)
 
-            # Set up system message
-            system_message = build_system_message(self.crew_chat_inputs)
+                # Set up system message
+                system_message = build_system_message(self.crew_chat_inputs)
 
-            # Generate introductory message
-            introductory_message = self.chat_llm.call(
-                messages=[{"role": "system", "content": system_message}]
-            )
+                # Generate introductory message
+                introductory_message = self.chat_llm.call(
+                    messages=[{"role": "system", "content": system_message}]
+                )
+
+                # Only cache complete setups so a bad intro is regenerated next time
+                if isinstance(introductory_message, str) and introductory_message:
+                    _chat_setup_cache.set(
+                        setup_key,
+                        {
+                            "crew_chat_inputs": self.crew_chat_inputs.model_dump(),
+                            "crew_tool_schema": crew_tool_schema,
+                            "system_message": system_message,
+                            "introductory_message": introductory_message,
+                        },
+                    )
+
+            self.required_inputs = [
+                {"name": field.name, "description": field.description}
+                for field in self.crew_chat_inputs.inputs
+            ]
+
+            # Sanitize tool schema to ensure valid function names
+            self.crew_tool_schema = self._sanitize_tool_schema(crew_tool_schema)
+            self._tools = [self.crew_tool_schema]
+            self._tools_hash = cache_key(self._tools)
 
             # Log a shorter version of the introductory message for debugging
-            if isinstance(introductory_message, str):
-                log_message = (
-                    introductory_message[:50] + "..."
-                    if len(introductory_message) > 50
-                    else introductory_message
-                )
-            else:
-                log_message = str(introductory_message)[:50] + "..."
+            if logger.isEnabledFor(logging.DEBUG):
+                if isinstance(introductory_message, str):
+                    log_message = (
+                        introductory_message[:50] + "..."
+                        if len(introductory_message) > 50
+                        else introductory_message
+                    )
+                else:
+                    log_message = str(introductory_message)[:50] + "..."
 
-            logging.debug(f"Received introductory message: {log_message}")
+                logger.debug("Received introductory message: %s", log_message)
 
             # Handle string or dictionary response
             if isinstance(introductory_message, str):
@@ -254,33 +403,25 @@ class ChatHandler:
             if original_name != sanitized_function_name:
                 self.available_functions[original_name] = self._create_tool_function()
 
+            self._available_functions_lower = {
+                name.lower(): function
+                for name, function in self.available_functions.items()
+            }
+
+            self.introductory_message = introductory_message
             self.is_initialized = True
             return introductory_message
 
         except Exception as e:
             error_message = f"Error initializing chat handler: {str(e)}"
-            logging.error(error_message)
+            logger.error(error_message)
             return error_message
 
-        finally:
-            # Stop loading indicator
-            loading_complete.set()
-            if loading_thread.is_alive():
-                loading_thread.join(timeout=1.0)
-
-    def _show_loading(self, event: threading.Event):
-        """Display animated loading indicator while processing."""
-        chars = "-\|/"
-        i = 0
-        while not event.is_set():
-            logging.debug(f"Processing... {chars[i % len(chars)]}")
-            i += 1
-            time.sleep(0.5)
-
     def _create_tool_function(self):
         """Create the tool function wrapper."""
 
         def run_crew_tool_with_messages(**kwargs):
+            self._crew_runs += 1
             return run_crew_tool(self.crew, self.messages, **kwargs)
 
         return run_crew_tool_with_messages
@@ -299,27 +440,18 @@ class ChatHandler:
         """
         # Ensure crew has a valid ID for telemetry tracking
         if not hasattr(self.crew, "id") or not self.crew.id:
-            import uuid
             self.crew.id = str(uuid.uuid4())
-            logging.info(f"Set crew ID to {self.crew.id} in run_crew method")
+            logger.info("Set crew ID to %s in run_crew method", self.crew.id)
         else:
-            logging.info(f"Using existing crew ID: {self.crew.id} in run_crew method")
+            logger.info("Using existing crew ID: %s in run_crew method", self.crew.id)
             
         if not self.is_initialized:
             self.initialize()
 
-        # Start loading indicator in a separate thread
-        loading_complete = threading.Event()
-        loading_thread = threading.Thread(
-            target=self._show_loading, args=(loading_complete,)
-        )
-        loading_thread.daemon = True
-        loading_thread.start()
-
         try:
             # Ensure we have the crew tool schema
             if not self.crew_tool_schema:
-                logging.warning("Crew tool schema not initialized, initializing now")
+                logger.warning("Crew tool schema not initialized, initializing now")
                 self.initialize()
 
             # Get the function name from the tool schema
@@ -349,49 +481,213 @@ class ChatHandler:
             return {"status": "success", "result": result}
         except Exception as e:
             error_message = f"Error running crew: {str(e)}"
-            logging.error(error_message, exc_info=True)
+            logger.error(error_message, exc_info=True)
             return {"status": "error", "error": error_message}
-        finally:
-            # Stop loading indicator
-            loading_complete.set()
-            if loading_thread.is_alive():
-                loading_thread.join(timeout=1.0)
 
-    def process_message(self, user_message: str) -> Dict[str, Any]:
+    async def _acall_llm(self, **kwargs) -> Any:
+        """Run a chat LLM call off the event loop.
+
+        Calls run on the shared LLM thread pool, which caps them at
+        ``LLM_CONCURRENCY_LIMIT`` across all handlers.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _llm_executor, functools.partial(self.chat_llm.call, **kwargs)
+        )
+
+    def _execute_tool_call(self, tool_call: Dict[str, Any]) -> Optional[str]:
+        """Execute a single tool call requested by the LLM.
+
+        Args:
+            tool_call: The tool call as returned by the LLM
+
+        Returns:
+            The stringified function response, or None if the function is unknown
+        """
+        function_name = tool_call["function"]["name"]
+        function_args = tool_call["function"]["arguments"]
+
+        # Try to find a matching function, even with slight name differences
+        function_to_call = self.available_functions.get(function_name)
+        if function_to_call is None:
+            # Try case-insensitive matching as fallback
+            function_to_call = self._available_functions_lower.get(function_name.lower())
+
+        # Log the result, but only if there's a problem
+        if not function_to_call:
+            logger.warning(
+                "Tool call requested unknown function '%s'. Available: %s",
+                function_name,
+                list(self.available_functions),
+            )
+            return None
+
+        # Handle parsing function arguments
+        try:
+            function_args_dict = _json_loads(function_args)
+        except (ValueError, TypeError) as e:
+            # Both json.JSONDecodeError and orjson.JSONDecodeError are ValueErrors;
+            # json.loads raises TypeError for non-string arguments such as None
+            logger.error("Error parsing function arguments: %s", e)
+            return f"Error: Could not parse function arguments: {str(e)}"
+
+        try:
+            logger.debug("Calling function %s", function_name)
+            function_response = function_to_call(**function_args_dict)
+        except Exception as e:
+            logger.error("Error executing function %s: %s", function_name, e)
+            function_response = f"Error executing function: {str(e)}"
+
+        # Ensure content is a string
+        return str(function_response)
+
+    async def _aexecute_tool_calls(
+        self, tool_calls: List[Dict[str, Any]]
+    ) -> List[Tuple[Dict[str, Any], str]]:
+        """Execute tool calls in a worker thread, dropping calls to unknown functions.
+
+        Calls run one after another: each one kicks off the same crew, which
+        isn't safe to run concurrently and resets the visualization state.
+
+        Returns:
+            (tool_call, function_response) pairs in the order they were requested
+        """
+        function_responses = await asyncio.to_thread(
+            lambda: [self._execute_tool_call(tool_call) for tool_call in tool_calls]
+        )
+        return [
+            (tool_call, function_response)
+            for tool_call, function_response in zip(tool_calls, function_responses)
+            if function_response is not None
+        ]
+
+    def _tool_call_messages(
+        self, executed_calls: List[Tuple[Dict[str, Any], str]]
+    ) -> List[Dict[str, Any]]:
+        """Build the assistant tool-call message followed by one response per call."""
+        return [
+            {
+                "role": "assistant",
+                "content": None,
+                "tool_calls": [tool_call for tool_call, _ in executed_calls],
+            },
+            *(
+                {
+                    "role": "tool",
+                    "tool_call_id": tool_call["id"],
+                    "content": function_response,
+                }
+                for tool_call, function_response in executed_calls
+            ),
+        ]
+
+    def _summary_messages(
+        self, user_message: str, tool_messages: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Build the small prompt used to summarize tool results for the user."""
+        return [
+            {"role": "system", "content": SUMMARY_INSTRUCTION},
+            {"role": "user", "content": user_message},
+            *tool_messages,
+        ]
+
+    @staticmethod
+    def _response_cache_enabled(use_cache: Optional[bool]) -> bool:
+        """Whether to use the response cache for a turn, defaulting to the env var."""
+        if use_cache is not None:
+            return use_cache
+        return os.environ.get(RESPONSE_CACHE_ENV_VAR, "").lower() in ("1", "true", "yes")
+
+    def _response_cache_key(self) -> str:
+        """Key the response cache on the model, tool schema and conversation so far."""
+        return cache_key(
+            getattr(self.chat_llm, "model", None), self._tools_hash, self.messages
+        )
+
+    def process_message(
+        self, user_message: str, use_cache: Optional[bool] = None
+    ) -> Dict[str, Any]:
         """
         Process a user message and return a response.
 
+        Synchronous wrapper around :meth:`aprocess_message`. Async callers
+        must await that directly instead.
+
         Args:
             user_message: The message from the user
+            use_cache: Override the response cache setting for this turn
+
+        Returns:
+            Dict with response content and status
+
+        Raises:
+            RuntimeError: If called while an event loop is running in this thread
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.aprocess_message(user_message, use_cache))
+
+        # Waiting here would block the caller's loop for the whole turn
+        raise RuntimeError(
+            "process_message() can't be called from a running event loop; "
+            "use 'await aprocess_message(...)' instead"
+        )
+
+    async def aprocess_message(
+        self, user_message: str, use_cache: Optional[bool] = None
+    ) -> Dict[str, Any]:
+        """
+        Process a user message and return a response without blocking the event loop.
+
+        LLM calls run in worker threads bounded by the shared concurrency limit,
+        and tool calls run in a worker thread one after another.
+
+        When the response cache is enabled (see ``RESPONSE_CACHE_ENV_VAR``),
+        replies to turns that didn't run the crew are reused for an identical
+        conversation.
+
+        Args:
+            user_message: The message from the user
+            use_cache: Override the response cache setting for this turn
 
         Returns:
             Dict with response content and status
         """
         if not self.is_initialized:
-            self.initialize()
+            await asyncio.to_thread(self.initialize)
 
         # Add user message to history
         self.messages.append({"role": "user", "content": user_message})
-
-        # Start loading indicator in a separate thread
-        loading_complete = threading.Event()
-        loading_thread = threading.Thread(
-            target=self._show_loading, args=(loading_complete,)
-        )
-        loading_thread.daemon = True
-        loading_thread.start()
+        self._trim_messages()
+
+        use_response_cache = self._response_cache_enabled(use_cache)
+        if use_response_cache:
+            response_key = self._response_cache_key()
+            cached_content = await asyncio.to_thread(_response_cache.get, response_key)
+            if cached_content is not None:
+                logger.debug("Using cached response")
+                self.messages.append({"role": "assistant", "content": cached_content})
+                return {
+                    "status": "success",
+                    "content": cached_content,
+                    "has_tool_call": False,
+                }
 
         try:
             # Ensure chat_llm is initialized - log minimal info
-            logging.debug("Sending messages to LLM")
-            logging.debug(
-                f"Using tool schema name: {self.crew_tool_schema['function']['name']}"
+            logger.debug("Sending messages to LLM")
+            logger.debug(
+                "Using tool schema name: %s", self.crew_tool_schema["function"]["name"]
             )
 
+            # The LLM may run the crew itself when given available_functions
+            crew_runs = self._crew_runs
+
             # Call the LLM with the updated messages including tool schema and available functions
-            response = self.chat_llm.call(
+            response = await self._acall_llm(
                 messages=self.messages,
-                tools=[self.crew_tool_schema],
+                tools=self._tools,
                 available_functions=self.available_functions,
             )
 
@@ -400,7 +696,7 @@ class ChatHandler:
             if isinstance(response, str):
                 # If response is an empty string, provide fallback content
                 if not response.strip():
-                    logging.warning(
+                    logger.warning(
                         "Empty string response from LLM, providing fallback"
                     )
                     content = "I'll help you with that. Let me process your request about AI agents in 2024."
@@ -412,138 +708,268 @@ class ChatHandler:
                 content = response.get("content", "")
                 # If content is empty but we have a response object, provide fallback
                 if not content and isinstance(response, dict):
-                    logging.warning(
+                    logger.warning(
                         "Empty content in response dict, providing fallback"
                     )
                     content = "I'll help you with that. Let me process your request about AI agents in 2024."
                 tool_calls = response.get("tool_calls", [])
 
-            logging.debug(f"Extracted content length: {len(content) if content else 0}")
-            logging.debug(
-                f"Number of tool calls: {len(tool_calls) if tool_calls else 0}"
-            )
+            logger.debug("Extracted content length: %d", len(content) if content else 0)
+            logger.debug("Number of tool calls: %d", len(tool_calls) if tool_calls else 0)
+
+            # Only plain replies are safe to reuse; crew runs have side effects
+            llm_content = response if isinstance(response, str) else response.get("content")
+            if (
+                use_response_cache
+                and not tool_calls
+                and self._crew_runs == crew_runs
+                and llm_content
+                and llm_content.strip()
+            ):
+                await asyncio.to_thread(_response_cache.set, response_key, content)
 
             # Add assistant response to messages
             self.messages.append({"role": "assistant", "content": content})
 
             # Process any tool calls
             if tool_calls:
-                for tool_call in tool_calls:
-                    # Extract function name and arguments
-                    function_name = tool_call["function"]["name"]
-                    function_args = tool_call["function"]["arguments"]
-
-                    # Add the tool call to messages with proper typing
-                    tool_call_message: AssistantMessageWithToolCalls = {
-                        "role": "assistant",
-                        "content": None,  # Can be None with our custom type
-                        "tool_calls": [cast(ToolCall, tool_call)],
-                    }
-                    # Type cast to allow adding to messages list
-                    self.messages.append(cast(Dict[str, Any], tool_call_message))
-
-                    # Try to find a matching function, even with slight name differences
-                    function_to_call = None
-                    if function_name in self.available_functions:
-                        function_to_call = self.available_functions[function_name]
-                    else:
-                        # Try case-insensitive matching as fallback
-                        function_name_lower = function_name.lower()
-                        for available_name in self.available_functions:
-                            if available_name.lower() == function_name_lower:
-                                function_to_call = self.available_functions[
-                                    available_name
-                                ]
-                                break
-
-                    # Log the result, but only if there's a problem
-                    if not function_to_call:
-                        logging.warning(
-                            f"Tool call requested unknown function '{function_name}'. Available: {list(self.available_functions.keys())}"
-                        )
+                # Execute the tool calls off the event loop
+                executed_calls = await self._aexecute_tool_calls(tool_calls)
+
+                if executed_calls:
+                    tool_messages = self._tool_call_messages(executed_calls)
+                    self.messages.extend(tool_messages)
+                    combined_response = "\n\n".join(
+                        function_response for _, function_response in executed_calls
+                    )
 
-                    # Execute the function if found
-                    if function_to_call:
-                        # Handle parsing function arguments
-                        try:
-                            function_args_dict = json.loads(function_args)
-                            logging.debug(f"Calling function {function_name}")
-                            function_response = function_to_call(**function_args_dict)
-                        except json.JSONDecodeError as e:
-                            logging.error(f"Error parsing function arguments: {str(e)}")
-                            function_response = (
-                                f"Error: Could not parse function arguments: {str(e)}"
-                            )
-                        except Exception as e:
-                            logging.error(
-                                f"Error executing function {function_name}: {str(e)}"
-                            )
-                            function_response = f"Error executing function: {str(e)}"
-
-                        # Add the function response to messages with proper typing
-                        tool_response_message: Dict[str, str] = {
-                            "role": "tool",
-                            "tool_call_id": tool_call["id"],
-                            "content": str(
-                                function_response
-                            ),  # Ensure content is a string
-                        }
-                        self.messages.append(tool_response_message)
-
-                        # Log that we're processing the function response (minimal info)
-                        logging.debug("Processing function response")
-
-                        # Get LLM to summarize the function response with appropriate parameters
-                        try:
-                            summary_response = self.chat_llm.call(
-                                messages=self.messages,
-                                tools=[self.crew_tool_schema],
-                                available_functions=self.available_functions,
-                            )
-
-                            # Handle string or dict response
-                            if isinstance(summary_response, str):
-                                summary_content = summary_response
-                            else:
-                                summary_content = summary_response.get("content", "")
-
-                            # Provide a fallback if summary is empty
-                            if not summary_content:
-                                summary_content = f"I've processed your request and received a response. Here's what I found: {function_response[:500]}"
-                        except Exception as e:
-                            logging.error(f"Error getting summary response: {str(e)}")
-                            summary_content = f"I've processed your request, but encountered an issue summarizing the results. Here's the raw output: {function_response[:500]}"
-
-                        # Add the summary response to messages
-                        self.messages.append(
-                            {"role": "assistant", "content": summary_content}
+                    # Log that we're processing the function response (minimal info)
+                    logger.debug("Processing function response")
+
+                    # Get LLM to summarize just the tool exchange, without offering tools again
+                    try:
+                        summary_response = await self._acall_llm(
+                            messages=self._summary_messages(user_message, tool_messages)
                         )
 
-                        # Update the content for the return value
-                        content = summary_content
+                        # Handle string or dict response
+                        if isinstance(summary_response, str):
+                            summary_content = summary_response
+                        else:
+                            summary_content = summary_response.get("content", "")
+
+                        # Provide a fallback if summary is empty
+                        if not summary_content:
+                            summary_content = f"I've processed your request and received a response. Here's what I found: {combined_response[:500]}"
+                    except Exception as e:
+                        logger.error("Error getting summary response: %s", e)
+                        summary_content = f"I've processed your request, but encountered an issue summarizing the results. Here's the raw output: {combined_response[:500]}"
+
+                    # Add the summary response to messages
+                    self.messages.append(
+                        {"role": "assistant", "content": summary_content}
+                    )
+
+                    # Update the content for the return value
+                    content = summary_content
 
             result = {
                 "status": "success",
                 "content": content,
                 "has_tool_call": bool(tool_calls),
             }
-            logging.debug("Returning success result")
+            logger.debug("Returning success result")
             return result
 
         except Exception as e:
             error_message = f"An error occurred: {str(e)}"
-            logging.error(f"Exception in process_message: {error_message}")
-            logging.error(f"Exception details:", exc_info=True)
+            logger.error("Exception in process_message: %s", error_message)
+            logger.error("Exception details:", exc_info=True)
             self.messages.append({"role": "assistant", "content": error_message})
             result = {
                 "status": "error",
                 "content": error_message,
                 "has_tool_call": False,
             }
-            logging.debug("Returning error result")
+            logger.debug("Returning error result")
             return result
-        finally:
-            # Stop loading indicator
-            loading_complete.set()
-            if loading_thread.is_alive():
-                loading_thread.join(timeout=1.0)
+
+    def _streaming_params(
+        self, messages: List[Dict[str, Any]], tools: Optional[List[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """Build litellm completion parameters for a streamed call to the chat LLM."""
+        params: Dict[str, Any] = {
+            "model": self.chat_llm.model,
+            "messages": messages,
+            "stream": True,
+        }
+        for attr in (
+            "temperature",
+            "max_tokens",
+            "timeout",
+            "api_key",
+            "base_url",
+            "api_base",
+            "api_version",
+        ):
+            value = getattr(self.chat_llm, attr, None)
+            if value is not None:
+                params[attr] = value
+        if tools:
+            params["tools"] = tools
+        return params
+
+    async def _astream_llm(
+        self,
+        messages: List[Dict[str, Any]],
+        tools: Optional[List[Dict[str, Any]]],
+        tool_calls: List[Dict[str, Any]],
+    ) -> AsyncIterator[str]:
+        """Stream content deltas from the chat LLM.
+
+        Tool-call deltas are assembled into complete tool calls and appended to
+        ``tool_calls`` instead of being yielded. At most ``LLM_CONCURRENCY_LIMIT``
+        streams are open at once.
+        """
+        partial_calls: Dict[int, Dict[str, Any]] = {}
+        async with _llm_stream_slots:
+            response = await litellm.acompletion(**self._streaming_params(messages, tools))
+
+            async for chunk in response:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta
+
+                for tool_call_delta in getattr(delta, "tool_calls", None) or []:
+                    partial = partial_calls.setdefault(
+                        tool_call_delta.index,
+                        {
+                            "id": "",
+                            "type": "function",
+                            "function": {"name": "", "arguments": ""},
+                        },
+                    )
+                    if tool_call_delta.id:
+                        partial["id"] = tool_call_delta.id
+                    function_delta = tool_call_delta.function
+                    if function_delta and function_delta.name:
+                        partial["function"]["name"] += function_delta.name
+                    if function_delta and function_delta.arguments:
+                        partial["function"]["arguments"] += function_delta.arguments
+
+                if delta.content:
+                    yield delta.content
+
+        tool_calls.extend(partial_calls[index] for index in sorted(partial_calls))
+
+    async def stream_message(
+        self, user_message: str, use_cache: Optional[bool] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Process a user message, yielding events as the LLM generates output.
+
+        Yields ``content`` events with text deltas, a ``tool`` event when the
+        crew is invoked (content streamed after it replaces what came before),
+        and a final ``done`` event carrying the complete response in the same
+        shape :meth:`process_message` returns.
+
+        Args:
+            user_message: The message from the user
+            use_cache: Override the response cache setting for this turn
+        """
+        # LLMs that aren't backed by a litellm model name can't be streamed
+        if not isinstance(getattr(self.chat_llm, "model", None), str):
+            yield {"type": "done", **await self.aprocess_message(user_message, use_cache)}
+            return
+
+        if not self.is_initialized:
+            await asyncio.to_thread(self.initialize)
+
+        # Add user message to history
+        self.messages.append({"role": "user", "content": user_message})
+        self._trim_messages()
+
+        use_response_cache = self._response_cache_enabled(use_cache)
+        if use_response_cache:
+            response_key = self._response_cache_key()
+            cached_content = await asyncio.to_thread(_response_cache.get, response_key)
+            if cached_content is not None:
+                logger.debug("Using cached response")
+                self.messages.append({"role": "assistant", "content": cached_content})
+                yield {"type": "content", "content": cached_content}
+                yield {
+                    "type": "done",
+                    "status": "success",
+                    "content": cached_content,
+                    "has_tool_call": False,
+                }
+                return
+
+        try:
+            tool_calls: List[Dict[str, Any]] = []
+            content_parts: List[str] = []
+            async for delta in self._astream_llm(
+                self.messages, self._tools, tool_calls
+            ):
+                content_parts.append(delta)
+                yield {"type": "content", "content": delta}
+            content = "".join(content_parts)
+
+            if use_response_cache and not tool_calls and content.strip():
+                await asyncio.to_thread(_response_cache.set, response_key, content)
+
+            # Add assistant response to messages
+            self.messages.append({"role": "assistant", "content": content})
+
+            if tool_calls:
+                yield {"type": "tool", "content": ""}
+
+                executed_calls = await self._aexecute_tool_calls(tool_calls)
+                if executed_calls:
+                    tool_messages = self._tool_call_messages(executed_calls)
+                    self.messages.extend(tool_messages)
+                    combined_response = "\n\n".join(
+                        function_response for _, function_response in executed_calls
+                    )
+
+                    # Stream the summary of just the tool exchange without offering tools again
+                    try:
+                        summary_parts: List[str] = []
+                        async for delta in self._astream_llm(
+                            self._summary_messages(user_message, tool_messages), None, []
+                        ):
+                            summary_parts.append(delta)
+                            yield {"type": "content", "content": delta}
+                        content = "".join(summary_parts)
+
+                        # Provide a fallback if summary is empty
+                        if not content:
+                            content = f"I've processed your request and received a response. Here's what I found: {combined_response[:500]}"
+                    except Exception as e:
+                        # The crew already ran, so keep its output rather than reporting an error;
+                        # the done event's content replaces any partial summary on the client
+                        logger.error("Error streaming summary response: %s", e)
+                        content = f"I've processed your request, but encountered an issue summarizing the results. Here's the raw output: {combined_response[:500]}"
+
+                    self.messages.append({"role": "assistant", "content": content})
+
+            if not content:
+                content = "I'm sorry, but I couldn't generate a response. Please try again."
+
+            yield {
+                "type": "done",
+                "status": "success",
+                "content": content,
+                "has_tool_call": bool(tool_calls),
+            }
+
+        except Exception as e:
+            error_message = f"An error occurred: {str(e)}"
+            logger.error("Exception in stream_message: %s", error_message, exc_info=True)
+            self.messages.append({"role": "assistant", "content": error_message})
+            yield {
+                "type": "done",
+                "status": "error",
+                "content": error_message,
+                "has_tool_call": False,
+            }
@@ -1,33 +1,164 @@
+import functools
+import importlib.metadata
 import importlib.util
+import logging
 import os
 import sys
+from collections import deque
 from pathlib import Path
-from typing import Optional, Tuple, Union, List, Dict, Any
+from types import ModuleType
+from typing import TYPE_CHECKING, Optional, Tuple, Union, List, Dict, Any, Iterator
 import re
 
-try:
-    import tomli
-except ImportError:
-    tomli = None  # type: ignore
+from crewai_chat_ui.json_cache import CACHE_DIR, JsonFileCache, cache_key
 
-from crewai.crew import Crew
+if TYPE_CHECKING:
+    # Imported lazily at runtime: file discovery doesn't need crewai loaded
+    from crewai.crew import Crew
 
+logger = logging.getLogger(__name__)
 
-def is_user_project_file(file_path: Path) -> bool:
-    """Filter out virtual environment paths and other system paths."""
-    path_str = str(file_path).lower()
-    excluded_patterns = [
+# Entry point group projects can use to register their crew explicitly
+CREW_ENTRY_POINT_GROUP = "crewai.crews"
+
+# Directories that never contain user crew files and can be skipped entirely
+_PRUNED_DIRS = frozenset(
+    {
         ".venv",
         "venv",
         "env",
+        "node_modules",
         "site-packages",
         "__pycache__",
         ".git",
         "dist",
         "build",
-        "egg-info",
-    ]
-    return not any(pattern in path_str for pattern in excluded_patterns)
+    }
+)
+
+# Additional file names commonly used for crew definitions
+_COMMON_CREW_FILE_NAMES = frozenset(
+    {"ai_crew.py", "agent_crew.py", "main_crew.py", "agents.py"}
+)
+
+# Module attribute names commonly used for crew instances, checked before a full scan
+_COMMON_CREW_ATTR_NAMES = ("crew", "my_crew", "the_crew", "ai_crew", "agent_crew")
+
+# Maximum number of arbitrary Python files returned when no crew files are found
+_FALLBACK_FILE_LIMIT = 10
+
+# Above this many Python files, guessing at arbitrary files is pointless
+_FALLBACK_MAX_PROJECT_FILES = 50
+
+# Crew module found by find_crew_module per working directory and pyproject.toml
+_crew_path_cache = JsonFileCache(CACHE_DIR / "crew_path.json", max_entries=32)
+
+# find_crew_modules results per directory, with the mtime of every directory
+# walked so that adding, removing or renaming any file invalidates them
+_crew_modules_cache: Dict[Tuple[str, str], Tuple[Dict[str, int], List[Path]]] = {}
+
+# Separators replaced by spaces when turning file or directory names into titles
+_TITLE_SEPARATOR_RE = re.compile(r"[_-]")
+_CREW_SUFFIX_RE = re.compile(r"\s*Crew$")
+
+# Characters that can't appear in a module name
+_NON_IDENTIFIER_RE = re.compile(r"\W")
+
+# load_crew_from_module results per resolved path, with the mtime they were loaded at
+_loaded_crews: Dict[str, Tuple[int, Tuple["Crew", str]]] = {}
+
+
+def _is_excluded_dir(name: str) -> bool:
+    """Check whether a directory name is one that never holds user project files."""
+    name = name.lower()
+    return name in _PRUNED_DIRS or name.endswith("egg-info")
+
+
+def is_user_project_file(file_path: Path) -> bool:
+    """Filter out virtual environment paths and other system paths."""
+    return not any(_is_excluded_dir(part) for part in file_path.parts)
+
+
+def walk_python_files(
+    directory: Path, dir_mtimes: Optional[Dict[str, int]] = None
+) -> Iterator[os.DirEntry]:
+    """Yield Python files under a directory breadth-first, skipping pruned directories.
+
+    Files are yielded as ``os.DirEntry`` objects so callers can filter on
+    ``entry.name`` and only build a ``Path`` for the files they keep.
+
+    Args:
+        directory: Directory to walk.
+        dir_mtimes: If given, filled with the mtime of each directory scanned.
+    """
+    pending = deque([str(directory)])
+    while pending:
+        current = pending.popleft()
+        try:
+            if dir_mtimes is not None:
+                # Stat before scanning so a change during the scan is still noticed
+                dir_mtimes[current] = os.stat(current).st_mtime_ns
+            with os.scandir(current) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError:
+            continue
+
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                continue
+            if is_dir:
+                if not _is_excluded_dir(entry.name):
+                    pending.append(entry.path)
+            elif entry.name.endswith(".py"):
+                yield entry
+
+
+def _collect_crew_files(
+    directory: Path,
+    first_only: bool = False,
+    dir_mtimes: Optional[Dict[str, int]] = None,
+) -> List[Path]:
+    """Collect potential crew files in a single pass over the directory tree.
+
+    Args:
+        directory: Directory to search in.
+        first_only: Stop at the first crew.py found instead of walking the whole tree.
+        dir_mtimes: If given, filled with the mtime of each directory scanned.
+
+    Returns:
+        List of paths to potential crew files, crew.py files first, then *_crew.py
+        files, then other common crew file names. If none are found in a small
+        project, up to _FALLBACK_FILE_LIMIT other Python files are returned instead.
+    """
+    crew_files: List[Path] = []
+    suffixed_files: List[Path] = []
+    common_files: List[Path] = []
+    other_files: List[Path] = []
+    python_file_count = 0
+
+    # The walk prunes excluded directories, so every file here is a user file
+    for entry in walk_python_files(directory, dir_mtimes):
+        python_file_count += 1
+        name = entry.name
+        if name == "crew.py":
+            if first_only:
+                return [Path(entry.path)]
+            crew_files.append(Path(entry.path))
+        elif name.endswith("_crew.py"):
+            suffixed_files.append(Path(entry.path))
+        elif name in _COMMON_CREW_FILE_NAMES:
+            common_files.append(Path(entry.path))
+        elif len(other_files) < _FALLBACK_FILE_LIMIT:
+            other_files.append(Path(entry.path))
+
+    crew_candidates = crew_files + suffixed_files + common_files
+    if crew_candidates or python_file_count > _FALLBACK_MAX_PROJECT_FILES:
+        return crew_candidates
+
+    # If we have no user project files, as a last resort, use any Python files found
+    return other_files
 
 
 def find_crew_modules(directory: Optional[Path] = None) -> List[Path]:
@@ -36,57 +167,64 @@ def find_crew_modules(directory: Optional[Path] = None) -> List[Path]:
     Args:
         directory: Optional directory to search in. If None, uses current working directory.
         
+    Results are memoized per directory until a file is added to, removed
+    from or renamed in any directory the walk visited.
+
     Returns:
         List of paths to potential crew files.
     """
     current_dir = directory or Path(os.getcwd())
+    cache_key = (str(current_dir), str(current_dir.resolve()))
 
-    # Collect all potential crew files
-    potential_crew_files = []
-    
-    # Look for the main crew files
-    all_crew_files = list(current_dir.glob("**/crew.py"))
-    potential_crew_files.extend([f for f in all_crew_files if is_user_project_file(f)])
-
-    # Look for any *_crew.py files
-    all_crew_files = list(current_dir.glob("**/*_crew.py"))
-    potential_crew_files.extend([f for f in all_crew_files if is_user_project_file(f)])
-
-    # Try specific common names as additional sources
-    common_names = ["ai_crew.py", "agent_crew.py", "main_crew.py", "agents.py"]
-    for name in common_names:
-        all_matches = list(current_dir.glob(f"**/{name}"))
-        matches = [f for f in all_matches if is_user_project_file(f)]
-        potential_crew_files.extend(matches)
-
-    # If we still have no user project files, as a last resort, check all Python files in the directory
-    if not potential_crew_files:
-        all_py_files = list(current_dir.glob("**/*.py"))
-        # Filter out system files and keep only user project files
-        filtered_files = [f for f in all_py_files if is_user_project_file(f)]
-        potential_crew_files.extend(filtered_files[:10])  # Limit to avoid excessive search
-
-    # Remove potential duplicates while preserving order
-    seen = set()
-    unique_crew_files = []
-    for file in potential_crew_files:
-        if str(file) not in seen:
-            seen.add(str(file))
-            unique_crew_files.append(file)
-    
-    return unique_crew_files
+    cached = _crew_modules_cache.get(cache_key)
+    if cached is not None and _directory_mtimes_unchanged(cached[0]):
+        return list(cached[1])
+
+    dir_mtimes: Dict[str, int] = {}
+    crew_files = _collect_crew_files(current_dir, dir_mtimes=dir_mtimes)
+    _crew_modules_cache[cache_key] = (dir_mtimes, crew_files)
+    return list(crew_files)
+
+
+def _directory_mtimes_unchanged(dir_mtimes: Dict[str, int]) -> bool:
+    """Check that none of the recorded directories have been modified since."""
+    try:
+        return all(
+            os.stat(path).st_mtime_ns == mtime for path, mtime in dir_mtimes.items()
+        )
+    except OSError:
+        return False
+
+
+def _crew_path_cache_key(directory: Path) -> str:
+    """Build a cache key from the directory and the mtime of its pyproject.toml."""
+    try:
+        mtime_ns = (directory / "pyproject.toml").stat().st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    return cache_key(str(directory.resolve()), mtime_ns)
 
 
 def find_crew_module():
     """Find a single crew module in current working directory.
     
+    The result is cached on disk, keyed on the working directory and the
+    mtime of its pyproject.toml, so repeated launches skip the tree walk.
+
     Returns:
         The first matching crew module.
         
     Raises:
         FileNotFoundError: If no crew files are found.
     """
-    potential_crew_files = find_crew_modules()
+    current_dir = Path(os.getcwd())
+    path_key = _crew_path_cache_key(current_dir)
+
+    cached_path = _crew_path_cache.get(path_key)
+    if cached_path and Path(cached_path).is_file():
+        return Path(cached_path)
+
+    potential_crew_files = _collect_crew_files(current_dir, first_only=True)
     
     if not potential_crew_files:
         raise FileNotFoundError(
@@ -94,12 +232,56 @@ def find_crew_module():
         )
 
     # Return the first match
-    return potential_crew_files[0]
+    crew_path = potential_crew_files[0]
+    _crew_path_cache.set(path_key, str(crew_path))
+    return crew_path
+
+
+def _import_crew_module(crew_path: Path, resolved_path: str) -> ModuleType:
+    """Import a crew module under a name unique to its resolved path."""
+    # Derive the module name from the full path so different files never collide
+    unique_module_name = f"crew_module_{_NON_IDENTIFIER_RE.sub('_', resolved_path)}"
 
+    spec = importlib.util.spec_from_file_location(unique_module_name, crew_path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Could not load module from {crew_path}")
+
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[unique_module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _to_title(name: str) -> str:
+    """Convert snake_case or kebab-case to title case."""
+    return _TITLE_SEPARATOR_RE.sub(" ", name).title()
+
+
+def _display_name_from_path(crew_path: Path) -> str:
+    """Build a crew display name from its directory or file name."""
+    return _display_name(crew_path.parent.name, crew_path.stem)
+
+
+@functools.lru_cache(maxsize=512)
+def _display_name(parent_dir: str, file_name: str) -> str:
+    """Build a crew display name, memoized since directory names tend to recur."""
+    if parent_dir and parent_dir != ".":
+        return _to_title(parent_dir)
+
+    # Convert the file name if it's not just 'crew.py'
+    if file_name != "crew":
+        # Remove 'Crew' suffix if present
+        return _CREW_SUFFIX_RE.sub("", _to_title(file_name))
 
-def load_crew_from_module(crew_path: Path) -> Tuple[Crew, str]:
+    return "Default Crew"
+
+
+def load_crew_from_module(crew_path: Path) -> Tuple["Crew", str]:
     """
     Load a crew instance from a specific module path.
+
+    Results are reused until the file's mtime changes, so selecting the same
+    crew again doesn't re-execute the module or rebuild the crew.
     
     Args:
         crew_path: Path to the crew module file
@@ -110,59 +292,67 @@ def load_crew_from_module(crew_path: Path) -> Tuple[Crew, str]:
     Raises:
         Various exceptions based on loading failures
     """
-    # Import the module
-    module_name = crew_path.stem
-    unique_module_name = f"{module_name}_{hash(str(crew_path)) % 10000}"
-    
-    spec = importlib.util.spec_from_file_location(unique_module_name, crew_path)
-    if spec is None or spec.loader is None:
-        raise ImportError(f"Could not load module from {crew_path}")
+    from crewai.crew import Crew
 
-    module = importlib.util.module_from_spec(spec)
-    sys.modules[unique_module_name] = module
-    spec.loader.exec_module(module)
+    resolved_path = str(crew_path.resolve())
+    mtime = crew_path.stat().st_mtime_ns
+
+    cached = _loaded_crews.get(resolved_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    module = _import_crew_module(crew_path, resolved_path)
 
     # Look for a Crew instance
     crew_instance = None
     crew_name = None
 
-    # First, look for direct crew instances in the module
-    for attr_name in dir(module):
-        if attr_name.startswith("__"):  # Skip built-in attributes
-            continue
-            
-        attr = getattr(module, attr_name)
-        if isinstance(attr, Crew):
-            crew_instance = attr
+    namespace = vars(module)
+
+    # Most projects use one of a few names for their crew, so try those first
+    for attr_name in _COMMON_CREW_ATTR_NAMES:
+        if isinstance(namespace.get(attr_name), Crew):
+            crew_instance = namespace[attr_name]
             crew_name = attr_name
             break
 
-    # If no direct instance, look for classes that might have a crew method
+    # Otherwise make one pass over the namespace: stop at a Crew instance,
+    # and remember the classes that define a crew method
+    candidate_classes: List[Tuple[str, type]] = []
     if crew_instance is None:
-        for attr_name in dir(module):
-            if attr_name.startswith("__"):  # Skip built-in attributes
+        for attr_name, attr in namespace.items():
+            if attr_name.startswith("_"):  # Skip built-in and private attributes
                 continue
 
-            attr = getattr(module, attr_name)
-            if isinstance(attr, type):  # Check if it's a class
-                try:
-                    # Try to instantiate the class
-                    instance = attr()
-
-                    # Look for crew methods on the instance
-                    if hasattr(instance, "crew") and callable(getattr(instance, "crew")):
-                        try:
-                            result = instance.crew()
-                            if isinstance(result, Crew):
-                                crew_instance = result
-                                crew_name = f"{attr_name}.crew"
-                                break
-                        except Exception:
-                            # Continue to the next class if this one fails
-                            pass
-                except Exception:
-                    # Continue to the next class if this one fails
-                    continue
+            if isinstance(attr, Crew):
+                crew_instance = attr
+                crew_name = attr_name
+                break
+            # Only classes with a crew method are worth instantiating
+            if isinstance(attr, type) and callable(getattr(attr, "crew", None)):
+                candidate_classes.append((attr_name, attr))
+
+    # If no direct instance, look for classes that might have a crew method
+    if crew_instance is None:
+        for attr_name, attr in candidate_classes:
+            try:
+                # Try to instantiate the class
+                instance = attr()
+
+                # Look for crew methods on the instance
+                if hasattr(instance, "crew") and callable(getattr(instance, "crew")):
+                    try:
+                        result = instance.crew()
+                        if isinstance(result, Crew):
+                            crew_instance = result
+                            crew_name = f"{attr_name}.crew"
+                            break
+                    except Exception:
+                        # Continue to the next class if this one fails
+                        pass
+            except Exception:
+                # Continue to the next class if this one fails
+                continue
 
     if crew_instance is None:
         raise ValueError(
@@ -171,25 +361,9 @@ def load_crew_from_module(crew_path: Path) -> Tuple[Crew, str]:
 
     # Generate a display name from the file path if needed
     if crew_name is None or crew_name == "crew":
-        # Try to create a more meaningful name from the directory or file name
-        parent_dir = crew_path.parent.name
-        file_name = crew_path.stem
-        
-        if parent_dir and parent_dir != ".":
-            # Convert snake_case or kebab-case to title case
-            parent_name = re.sub(r'[_-]', ' ', parent_dir).title()
-            crew_name = parent_name
-        else:
-            # Convert the file name if it's not just 'crew.py'
-            if file_name != "crew":
-                # Convert snake_case or kebab-case to title case
-                file_name = re.sub(r'[_-]', ' ', file_name).title()
-                # Remove 'Crew' suffix if present
-                file_name = re.sub(r'\s*Crew$', '', file_name)
-                crew_name = file_name
-            else:
-                crew_name = "Default Crew"
-    
+        crew_name = _display_name_from_path(crew_path)
+
+    _loaded_crews[resolved_path] = (mtime, (crew_instance, crew_name))
     return crew_instance, crew_name
 
 
@@ -215,46 +389,75 @@ def discover_available_crews(directory: Optional[Path] = None) -> List[Dict[str,
         try:
             # Try to get crew display name without loading the entire crew
             # This is a lightweight approach to just get names initially
+            # The walk builds every path from search_dir, so it's always an ancestor
             relative_path = crew_path.relative_to(search_dir)
-            parent_dir = crew_path.parent.name
-            file_name = crew_path.stem
-            
-            # Generate a display name from the file path
-            if parent_dir and parent_dir != ".":
-                # Convert snake_case or kebab-case to title case
-                display_name = re.sub(r'[_-]', ' ', parent_dir).title()
-            else:
-                # Convert the file name if it's not just 'crew.py'
-                if file_name != "crew":
-                    # Convert snake_case or kebab-case to title case
-                    display_name = re.sub(r'[_-]', ' ', file_name).title()
-                    # Remove 'Crew' suffix if present
-                    display_name = re.sub(r'\s*Crew$', '', display_name)
-                else:
-                    display_name = "Default Crew"
-            
+            display_name = _display_name_from_path(crew_path)
+
             crews_info.append({
                 "path": str(crew_path),
                 "name": display_name,
-                "directory": str(crew_path.parent.relative_to(search_dir) if search_dir != crew_path.parent else ".")
+                # Path(".") renders as "." for crews directly in search_dir
+                "directory": str(relative_path.parent),
             })
         except Exception as e:
-            print(f"Error processing crew at {crew_path}: {e}")
+            logger.debug("Error processing crew at %s: %s", crew_path, e)
     
     return crews_info
 
 
-def load_crew() -> Tuple[Crew, Optional[str]]:
+def load_crew_from_entry_points() -> Optional[Tuple["Crew", str]]:
+    """
+    Load a crew registered under the ``crewai.crews`` entry point group.
+
+    Projects can register a Crew instance, a function returning one, or a class
+    with a ``crew`` method in their pyproject.toml::
+
+        [project.entry-points."crewai.crews"]
+        my_crew = "my_project.crew:MyCrew"
+
+    Returns:
+        Tuple[Crew, str] for the first registered crew, or None if none are registered
+
+    Raises:
+        ValueError: If the entry point doesn't resolve to a Crew
+    """
+    from crewai.crew import Crew
+
+    entry_points = importlib.metadata.entry_points(group=CREW_ENTRY_POINT_GROUP)
+    for entry_point in entry_points:
+        target = entry_point.load()
+
+        crew_instance = target
+        if not isinstance(crew_instance, Crew) and callable(crew_instance):
+            crew_instance = crew_instance()
+        if not isinstance(crew_instance, Crew) and callable(
+            getattr(crew_instance, "crew", None)
+        ):
+            crew_instance = crew_instance.crew()
+
+        if not isinstance(crew_instance, Crew):
+            raise ValueError(
+                f"Entry point '{entry_point.name}' ({entry_point.value}) did not produce a Crew instance."
+            )
+
+        return crew_instance, _to_title(entry_point.name)
+
+    return None
+
+
+def load_crew() -> Tuple["Crew", Optional[str]]:
     """
     Load the crew instance from the user's project.
-    Specifically looks for classes with crew methods.
+    Crews registered under the ``crewai.crews`` entry point group take
+    precedence; otherwise looks for classes with crew methods.
 
     Returns:
         Tuple[Crew, str]: A tuple containing the crew instance and crew name
     """
-    try:
-        # Find the crew module
-        crew_path = find_crew_module()
-        return load_crew_from_module(crew_path)
-    except Exception as e:
-        raise
+    registered_crew = load_crew_from_entry_points()
+    if registered_crew is not None:
+        return registered_crew
+
+    # Find the crew module
+    crew_path = find_crew_module()
+    return load_crew_from_module(crew_path)
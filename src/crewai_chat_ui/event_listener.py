@@ -1,7 +1,9 @@
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Set, Tuple
 import json
 import asyncio
+import threading
+from collections import Counter, defaultdict
 from datetime import datetime
 from fastapi import WebSocket
 from crewai.utilities.events import (
@@ -21,20 +23,54 @@ from crewai.utilities.events.base_event_listener import BaseEventListener
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
+# Seconds to wait on a single client before treating it as dead
+SEND_TIMEOUT = 5.0
+# Clients sent to per event-loop iteration when broadcasting to many clients
+BROADCAST_BATCH_SIZE = 50
+# Minimum seconds between broadcasts; state changes within it are coalesced
+BROADCAST_INTERVAL = 0.02
+
 # Custom JSON encoder to handle datetime objects and other custom types
 class CustomJSONEncoder(json.JSONEncoder):
     def default(self, obj):
         if isinstance(obj, datetime):
             return obj.isoformat()
-        # Handle TaskOutput objects
-        if hasattr(obj, '__dict__'):
-            return str(obj)
-        # Try to convert to string if all else fails
+        # Anything else, e.g. TaskOutput objects, is sent as its string form
         try:
             return str(obj)
-        except:
+        except Exception:
             return "[Unserializable Object]"
-        return super().default(obj)
+
+
+try:
+    import orjson
+
+    def _default(obj: Any) -> str:
+        """Serialize objects orjson does not know, e.g. TaskOutput, as text."""
+        return str(obj)
+
+    def _serialize(update: Dict[str, Any]) -> str:
+        """Serialize a state update to JSON text."""
+        return orjson.dumps(update, default=_default).decode("utf-8")
+
+except ImportError:
+    # orjson not installed; fall back to the stdlib encoder
+
+    def _serialize(update: Dict[str, Any]) -> str:
+        """Serialize a state update to JSON text."""
+        return json.dumps(update, cls=CustomJSONEncoder)
+
+
+def short_description(text: str, limit: int = 100) -> str:
+    """Truncate text for display, returning it unchanged when short enough."""
+    return text if len(text) <= limit else f"{text[:limit]}..."
+
+
+def _object_id(obj: Any) -> Optional[str]:
+    """Return the string form of an object's ``id`` attribute, if it has one."""
+    raw_id = getattr(obj, "id", None)
+    return None if raw_id is None else str(raw_id)
+
 
 class CrewVisualizationListener(BaseEventListener):
     """Event listener for visualizing crew execution in the UI."""
@@ -42,90 +78,256 @@ class CrewVisualizationListener(BaseEventListener):
     def __init__(self):
         self._registered_buses = set()
         super().__init__()
-        self.active_connections: List[WebSocket] = []
+        self.active_connections: Set[WebSocket] = set()
         self.crew_state: Dict[str, Any] = {}
         self.agent_states: Dict[str, Dict[str, Any]] = {}
         self.task_states: Dict[str, Dict[str, Any]] = {}
+        # Set on first connect so sync event callbacks can schedule broadcasts
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        # Crew items and serialized agent/task entries as of the last broadcast
+        self._broadcast_crew_items: Optional[tuple] = None
+        self._agent_json: Dict[str, Tuple[tuple, str]] = {}
+        self._task_json: Dict[str, Tuple[tuple, str]] = {}
+        self._dirty = False
+        self._broadcast_task: Optional[asyncio.Task] = None
         
     async def connect(self, websocket: WebSocket):
         """Connect a new WebSocket client."""
         # Capture the running loop so we can schedule updates from sync event callbacks
         self.loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
 
         await websocket.accept()
-        self.active_connections.append(websocket)
-        logger.info(f"WebSocket client connected. Total connections: {len(self.active_connections)}")
+        self.active_connections.add(websocket)
+        logger.info("WebSocket client connected. Total connections: %d", len(self.active_connections))
         # Always send current state to the new client, even if empty
-        logger.info(f"Sending initial state to new client")
+        logger.info("Sending initial state to new client")
         await self.send_update(websocket)
     
     def disconnect(self, websocket: WebSocket):
         """Disconnect a WebSocket client."""
         if websocket in self.active_connections:
             self.active_connections.remove(websocket)
-            logger.info(f"WebSocket client disconnected. Remaining connections: {len(self.active_connections)}")
+            logger.info("WebSocket client disconnected. Remaining connections: %d", len(self.active_connections))
     
     async def broadcast_update(self):
-        """Broadcast the current state to all connected WebSocket clients."""
+        """Broadcast state changes since the last broadcast to all connected clients."""
         if not self.active_connections:
             logger.info("No active connections to broadcast to")
             return
             
-        logger.info(f"Broadcasting update to {len(self.active_connections)} clients")
-        for connection in self.active_connections.copy():
-            try:
-                await self.send_update(connection)
-            except Exception as e:
-                logger.error(f"Error broadcasting update: {str(e)}")
-                # Connection might be closed, will be cleaned up in send_update
+        # Every client receives the same changes, so serialize them only once
+        payload = self._delta_payload()
+        if payload is None:
+            return
+
+        logger.info("Broadcasting update to %d clients", len(self.active_connections))
+        connections = tuple(self.active_connections)
+        # Send to clients concurrently so one slow client cannot delay the rest,
+        # yielding to the event loop between batches when there are many clients
+        for start in range(0, len(connections), BROADCAST_BATCH_SIZE):
+            if start:
+                await asyncio.sleep(0)
+            results = await asyncio.gather(
+                *(
+                    self._safe_send(connection, payload)
+                    for connection in connections[start : start + BROADCAST_BATCH_SIZE]
+                )
+            )
+            for connection in results:
+                if connection is not None:
+                    self.disconnect(connection)
     
+    async def _safe_send(self, websocket: WebSocket, payload: str) -> Optional[WebSocket]:
+        """Send a payload to one client.
+
+        Returns:
+            The WebSocket if the send failed or timed out, otherwise None
+        """
+        try:
+            await asyncio.wait_for(websocket.send_text(payload), timeout=SEND_TIMEOUT)
+            return None
+        except Exception as e:
+            logger.error("Error broadcasting update: %s", str(e) or type(e).__name__)
+            return websocket
+
+    def _mark_dirty(self):
+        """Request a broadcast of the current state from any thread.
+
+        Requests made while a broadcast is pending or in progress are
+        coalesced, so a burst of events results in at most one broadcast
+        per BROADCAST_INTERVAL. Nothing is scheduled while no clients are
+        connected; clients that connect later receive a full snapshot.
+        """
+        if not self.active_connections:
+            return
+
+        loop = self.loop
+        if loop is None:
+            return
+
+        self._dirty = True
+        if threading.get_ident() == self._loop_thread_id:
+            # Already on the loop thread; skip the cross-thread wakeup
+            self._ensure_broadcast_task()
+        else:
+            loop.call_soon_threadsafe(self._ensure_broadcast_task)
+
+    def _ensure_broadcast_task(self):
+        """Start the broadcast task on the event loop unless one is running."""
+        if self._broadcast_task is None:
+            self._broadcast_task = self.loop.create_task(self._broadcast_pending())
+
+    async def _broadcast_pending(self):
+        """Broadcast until no further state changes are pending."""
+        try:
+            while self._dirty:
+                self._dirty = False
+                await self.broadcast_update()
+                await asyncio.sleep(BROADCAST_INTERVAL)
+        finally:
+            self._broadcast_task = None
+
+    def _state_payload(self) -> str:
+        """Serialize the full crew, agent and task state."""
+        agents, _ = self._entry_fragments(self.agent_states, self._agent_json, changed_only=False)
+        tasks, _ = self._entry_fragments(self.task_states, self._task_json, changed_only=False)
+        return (
+            '{"crew":' + _serialize(dict(self.crew_state))
+            + ',"agents":[' + ",".join(agents)
+            + '],"tasks":[' + ",".join(tasks)
+            + "]}"
+        )
+
+    def _delta_payload(self) -> Optional[str]:
+        """Serialize the state that changed since the last broadcast.
+
+        Clients merge the crew fields and the agent and task entries by id, so
+        sending only the changed parts leaves them with the same state as a
+        full snapshot would. The broadcast caches are only updated once the
+        whole payload has been built.
+
+        Returns:
+            The JSON payload, or None if nothing changed
+        """
+        parts = []
+        # Event handlers on crew threads mutate the state while we read it,
+        # so work from snapshots
+        crew_state = dict(self.crew_state)
+        crew_items = tuple(crew_state.items())
+        crew_changed = crew_items != self._broadcast_crew_items
+        if crew_changed:
+            parts.append('"crew":' + _serialize(crew_state))
+
+        cache_updates = []
+        for key, states, cache in (
+            ("agents", self.agent_states, self._agent_json),
+            ("tasks", self.task_states, self._task_json),
+        ):
+            fragments, changed = self._entry_fragments(states, cache, changed_only=True)
+            if fragments:
+                parts.append(f'"{key}":[' + ",".join(fragments) + "]")
+                cache_updates.append((cache, changed))
+
+        if not parts:
+            return None
+        payload = "{" + ",".join(parts) + "}"
+
+        if crew_changed:
+            self._broadcast_crew_items = crew_items
+        for cache, changed in cache_updates:
+            cache.update(changed)
+        return payload
+
+    @staticmethod
+    def _entry_fragments(
+        states: Dict[str, Dict[str, Any]],
+        cache: Dict[str, Tuple[tuple, str]],
+        changed_only: bool,
+    ) -> Tuple[List[str], Dict[str, Tuple[tuple, str]]]:
+        """Serialize agent or task entries, reusing the JSON of unchanged ones.
+
+        Args:
+            states: Agent or task entries keyed by id
+            cache: Items and JSON of each entry as of the last broadcast
+            changed_only: Return only entries changed since the last broadcast
+
+        Returns:
+            One JSON object string per returned entry, and the items and JSON
+            of each changed entry for the caller to record in ``cache``
+        """
+        fragments = []
+        changed = {}
+        for entry_id, entry in list(states.items()):
+            entry = dict(entry)
+            items = tuple(entry.items())
+            cached = cache.get(entry_id)
+            if cached is not None and cached[0] == items:
+                if not changed_only:
+                    fragments.append(cached[1])
+                continue
+
+            fragment = _serialize(entry)
+            changed[entry_id] = (items, fragment)
+            fragments.append(fragment)
+        return fragments, changed
+
     async def send_update(self, websocket: WebSocket):
         """Send the current state to a specific WebSocket client."""
-        update = {
-            "crew": self.crew_state,
-            "agents": list(self.agent_states.values()),
-            "tasks": list(self.task_states.values()),
-        }
-        json_data = json.dumps(update, cls=CustomJSONEncoder)
         try:
-            await websocket.send_text(json_data)
-            logger.debug(f"Sent update to WebSocket client")
+            await websocket.send_text(self._state_payload())
+            logger.debug("Sent update to WebSocket client")
         except Exception as e:
-            logger.error(f"Error sending update: {str(e)}")
+            logger.error("Error sending update: %s", e)
             # Remove the connection if it's closed
             if websocket in self.active_connections:
                 self.active_connections.remove(websocket)
-                logger.info(f"Removed closed connection. Remaining: {len(self.active_connections)}")
+                logger.info("Removed closed connection. Remaining: %d", len(self.active_connections))
                 
+    def register_crew(
+        self,
+        crew_state: Dict[str, Any],
+        agent_states: Dict[str, Dict[str, Any]],
+        task_states: Dict[str, Dict[str, Any]],
+    ):
+        """Register a crew and all of its agents and tasks in a single update."""
+        self.crew_state = crew_state
+        self.agent_states.update(agent_states)
+        self.task_states.update(task_states)
+
     def reset_state(self):
         """Reset the state when a new crew execution starts."""
         self.crew_state = {}
         self.agent_states = {}
         self.task_states = {}
+        self._broadcast_crew_items = None
+        self._agent_json = {}
+        self._task_json = {}
         logger.info("State reset for new crew execution")
     
     def setup_listeners(self, crewai_event_bus):
         """Set up event listeners for crew visualization."""
         bus_id = id(crewai_event_bus)
         if bus_id in self._registered_buses:
-            logger.info(f"Listeners already set up for event bus {bus_id}.")
+            logger.info("Listeners already set up for event bus %s.", bus_id)
             return
 
-        logger.info(f"Setting up new listeners for event bus {bus_id}")
+        logger.info("Setting up new listeners for event bus %s", bus_id)
         self._registered_buses.add(bus_id)
         
         @crewai_event_bus.on(CrewKickoffStartedEvent)
         def on_crew_kickoff_started(source, event):
-            logger.info(f"Crew '{event.crew_name}' execution started")
+            logger.info("Crew '%s' execution started", event.crew_name)
             
             # Reset state for new execution
             self.reset_state()
             
             # Get crew ID - ensure it's a string and normalize it
-            crew_id = str(source.id) if hasattr(source, "id") else "unknown"
+            crew_id = _object_id(source) or "unknown"
             
             # Log the crew ID for debugging
-            logger.info(f"CrewKickoffStartedEvent - Using crew_id: {crew_id}")
+            logger.info("CrewKickoffStartedEvent - Using crew_id: %s", crew_id)
             
             # Store crew information
             self.crew_state = {
@@ -140,13 +342,13 @@ class CrewVisualizationListener(BaseEventListener):
             
             # Store agent information
             for agent in source.agents:
-                agent_id = str(agent.id) if hasattr(agent, "id") else f"agent_{len(self.agent_states)}"
+                agent_id = _object_id(agent) or f"agent_{len(self.agent_states)}"
                 self.agent_states[agent_id] = {
                     "id": agent_id,
                     "role": agent.role,
-                    "name": agent.name if hasattr(agent, "name") else agent.role,
+                    "name": getattr(agent, "name", agent.role),
                     "status": "waiting",
-                    "description": agent.backstory[:100] + "..." if len(agent.backstory) > 100 else agent.backstory,
+                    "description": short_description(agent.backstory),
                 }
             
             # Store task information if available and associate with agents
@@ -155,89 +357,96 @@ class CrewVisualizationListener(BaseEventListener):
                 agent_by_role = {}
                 agent_by_id = {}
                 for agent in source.agents:
-                    agent_id = str(agent.id) if hasattr(agent, "id") else None
+                    agent_id = _object_id(agent)
                     if agent_id:
                         agent_by_id[agent_id] = agent
                         role_key = agent.role.lower() if hasattr(agent, "role") else ""
                         agent_by_role[role_key] = agent_id
+                ordered_agent_ids = list(agent_by_id)
+
+                # Index the significant words (longer than 3 chars) of each role
+                # so every task is scored against all roles in one pass
+                role_agent_ids = [agent_id for role, agent_id in agent_by_role.items() if role]
+                word_to_roles = defaultdict(list)
+                research_roles = []
+                analyst_roles = []
+                for index, role in enumerate(role for role in agent_by_role if role):
+                    for word in set(role.split()):
+                        if len(word) > 3:
+                            word_to_roles[word].append(index)
+                    if "research" in role:
+                        research_roles.append(index)
+                    if "analyst" in role:
+                        analyst_roles.append(index)
                 
                 # Process tasks and try to associate them with agents
                 for i, task in enumerate(source.tasks):
-                    task_id = str(task.id) if hasattr(task, "id") else f"task_{i}"
+                    task_id = _object_id(task) or f"task_{i}"
                     task_desc = task.description.lower() if hasattr(task, "description") else ""
                     
-                    # Try to find an agent for this task
-                    assigned_agent_id = None
-                    
                     # First check if task already has an agent assigned
-                    if hasattr(task, "agent") and task.agent:
-                        agent_id = str(task.agent.id) if hasattr(task.agent, "id") else None
-                        if agent_id:
-                            assigned_agent_id = agent_id
+                    assigned_agent_id = _object_id(getattr(task, "agent", None))
                     
                     # If no agent is assigned, try to match based on task description and agent roles
                     if not assigned_agent_id:
                         # Try to match based on keywords in task description and agent roles
+                        scores = Counter()
+                        for word in set(task_desc.split()):
+                            for index in word_to_roles.get(word, ()):
+                                scores[index] += 1
+                        
+                        # Special case handling for common patterns
+                        mentions_research = "research" in task_desc
+                        mentions_analysis = any(kw in task_desc for kw in ["analyz", "review", "report"])
+                        if mentions_research:
+                            for index in research_roles:
+                                scores[index] += 3
+                        if mentions_analysis:
+                            for index in analyst_roles:
+                                scores[index] += 3
+                        
+                        # Highest score wins; ties go to the earliest role
                         best_match = None
                         best_match_score = 0
-                        
-                        for role, agent_id in agent_by_role.items():
-                            # Skip empty roles
-                            if not role:
-                                continue
-                                
-                            # Calculate a simple matching score
-                            role_words = set(role.split())
-                            task_words = set(task_desc.split())
-                            
-                            # Count matching significant words (longer than 3 chars)
-                            match_score = sum(1 for word in role_words & task_words if len(word) > 3)
-                            
-                            # Special case handling for common patterns
-                            if "research" in role and "research" in task_desc:
-                                match_score += 3
-                            if "analyst" in role and any(kw in task_desc for kw in ["analyz", "review", "report"]):
-                                match_score += 3
-                            
-                            if match_score > best_match_score:
-                                best_match_score = match_score
-                                best_match = agent_id
+                        if scores:
+                            best_index = min(scores, key=lambda index: (-scores[index], index))
+                            best_match_score = scores[best_index]
+                            best_match = role_agent_ids[best_index]
                         
                         # If we found a reasonable match, assign the task to this agent
                         if best_match_score > 0:
                             assigned_agent_id = best_match
                         # If we still don't have a match but there's only one agent, assign to it
-                        elif len(agent_by_id) == 1:
-                            assigned_agent_id = next(iter(agent_by_id.keys()))
+                        elif len(ordered_agent_ids) == 1:
+                            assigned_agent_id = ordered_agent_ids[0]
                         # If we have exactly two agents and can identify researcher/analyst pattern
-                        elif len(agent_by_id) == 2:
+                        elif len(ordered_agent_ids) == 2:
                             # For a research task, assign to the first agent
-                            if "research" in task_desc:
-                                assigned_agent_id = list(agent_by_id.keys())[0]
+                            if mentions_research:
+                                assigned_agent_id = ordered_agent_ids[0]
                             # For a reporting/analysis task, assign to the second agent
-                            elif any(kw in task_desc for kw in ["report", "analyz", "review", "summarize"]):
-                                assigned_agent_id = list(agent_by_id.keys())[1]
+                            elif mentions_analysis or "summarize" in task_desc:
+                                assigned_agent_id = ordered_agent_ids[1]
                     
                     # Store the task with its assigned agent (if any)
                     self.task_states[task_id] = {
                         "id": task_id,
-                        "description": task.description if hasattr(task, "description") else "",
+                        "description": getattr(task, "description", ""),
                         "status": "pending",
                         "agent_id": assigned_agent_id,
                     }
             
             # Broadcast the update asynchronously
             # Schedule the broadcast on the main event loop
-            if hasattr(self, "loop"):
-                asyncio.run_coroutine_threadsafe(self.broadcast_update(), self.loop)
+            self._mark_dirty()
         
         @crewai_event_bus.on(AgentExecutionStartedEvent)
         def on_agent_execution_started(source, event):
             agent = event.agent
-            agent_id = str(agent.id) if hasattr(agent, "id") else None
+            agent_id = _object_id(agent)
             
             if agent_id and agent_id in self.agent_states:
-                logger.info(f"Agent '{agent.role}' started execution")
+                logger.info("Agent '%s' started execution", agent.role)
                 
                 # Update agent status
                 self.agent_states[agent_id]["status"] = "running"
@@ -249,31 +458,27 @@ class CrewVisualizationListener(BaseEventListener):
                     telemetry_service.start_agent_execution(
                         crew_id=crew_id,
                         agent_id=agent_id,
-                        agent_name=agent.name if hasattr(agent, "name") else agent.role,
+                        agent_name=getattr(agent, "name", agent.role),
                         agent_role=agent.role
                     )
                 
                 # If there's a task associated with this execution, update it
-                if hasattr(event, "task"):
-                    task = event.task
-                    task_id = str(task.id) if hasattr(task, "id") else None
-                    
-                    if task_id and task_id in self.task_states:
-                        self.task_states[task_id]["status"] = "running"
-                        self.task_states[task_id]["agent_id"] = agent_id
+                task_id = _object_id(getattr(event, "task", None))
+                if task_id and task_id in self.task_states:
+                    self.task_states[task_id]["status"] = "running"
+                    self.task_states[task_id]["agent_id"] = agent_id
                 
                 # Broadcast the update asynchronously
                 # Schedule the broadcast on the main event loop
-            if hasattr(self, "loop"):
-                asyncio.run_coroutine_threadsafe(self.broadcast_update(), self.loop)
+                self._mark_dirty()
         
         @crewai_event_bus.on(AgentExecutionCompletedEvent)
         def on_agent_execution_completed(source, event):
             agent = event.agent
-            agent_id = str(agent.id) if hasattr(agent, "id") else None
+            agent_id = _object_id(agent)
             
             if agent_id and agent_id in self.agent_states:
-                logger.info(f"Agent '{agent.role}' completed execution")
+                logger.info("Agent '%s' completed execution", agent.role)
                 
                 # Update agent status
                 self.agent_states[agent_id]["status"] = "completed"
@@ -285,43 +490,38 @@ class CrewVisualizationListener(BaseEventListener):
                     telemetry_service.end_agent_execution(
                         crew_id=crew_id,
                         agent_id=agent_id,
-                        output=event.output if hasattr(event, "output") else None
+                        output=getattr(event, "output", None)
                     )
                 
                 # If there's a task associated with this execution, update it
-                if hasattr(event, "task"):
-                    task = event.task
-                    task_id = str(task.id) if hasattr(task, "id") else None
-                    
-                    if task_id and task_id in self.task_states:
-                        self.task_states[task_id]["status"] = "completed"
+                task_id = _object_id(getattr(event, "task", None))
+                if task_id and task_id in self.task_states:
+                    self.task_states[task_id]["status"] = "completed"
                 
                 # Broadcast the update asynchronously
                 # Schedule the broadcast on the main event loop
-            if hasattr(self, "loop"):
-                asyncio.run_coroutine_threadsafe(self.broadcast_update(), self.loop)
+                self._mark_dirty()
         
         @crewai_event_bus.on(TaskStartedEvent)
         def on_task_started(source, event):
             task = event.task
-            task_id = str(task.id) if hasattr(task, "id") else None
+            task_id = _object_id(task)
             
             if task_id:
-                logger.info(f"Task '{task.description[:30]}...' started")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Task '%s...' started", task.description[:30])
+                
+                # Get agent ID if the task has an agent directly assigned
+                agent_id = _object_id(getattr(task, "agent", None))
                 
                 # Get crew ID
                 crew_id = self.crew_state.get("id")
                 if crew_id:
-                    # Get agent ID if available
-                    agent_id = None
-                    if hasattr(task, "agent") and task.agent:
-                        agent_id = str(task.agent.id) if hasattr(task.agent, "id") else None
-                    
                     # Record in telemetry
                     telemetry_service.start_task_execution(
                         crew_id=crew_id,
                         task_id=task_id,
-                        task_description=task.description if hasattr(task, "description") else "",
+                        task_description=getattr(task, "description", ""),
                         agent_id=agent_id
                     )
                 
@@ -329,25 +529,17 @@ class CrewVisualizationListener(BaseEventListener):
                 if task_id not in self.task_states:
                     self.task_states[task_id] = {
                         "id": task_id,
-                        "description": task.description if hasattr(task, "description") else "",
+                        "description": getattr(task, "description", ""),
                         "status": "running",
                         "agent_id": None,
                     }
                 else:
                     self.task_states[task_id]["status"] = "running"
                 
-                # If there's an agent assigned to this task, update it
-                agent_id = None
-                
-                # First check if task has an agent directly assigned
-                if hasattr(task, "agent") and task.agent:
-                    agent = task.agent
-                    agent_id = str(agent.id) if hasattr(agent, "id") else None
-                
                 # If no agent is directly assigned, check if the source is an agent
-                if not agent_id and hasattr(source, "id") and hasattr(source, "role"):
+                if not agent_id and hasattr(source, "role"):
                     # The source might be the agent executing this task
-                    agent_id = str(source.id)
+                    agent_id = _object_id(source)
                 
                 # If we found an agent ID, update the task and agent states
                 if agent_id:
@@ -360,20 +552,20 @@ class CrewVisualizationListener(BaseEventListener):
                         
                         # Log the association
                         agent_name = self.agent_states[agent_id].get("name", "Unknown agent")
-                        logger.info(f"Associated task '{task_id}' with agent '{agent_name}' (ID: {agent_id})")
+                        logger.info("Associated task '%s' with agent '%s' (ID: %s)", task_id, agent_name, agent_id)
                 
                 # Broadcast the update asynchronously
                 # Schedule the broadcast on the main event loop
-            if hasattr(self, "loop"):
-                asyncio.run_coroutine_threadsafe(self.broadcast_update(), self.loop)
+                self._mark_dirty()
         
         @crewai_event_bus.on(TaskCompletedEvent)
         def on_task_completed(source, event):
             task = event.task
-            task_id = str(task.id) if hasattr(task, "id") else None
+            task_id = _object_id(task)
             
             if task_id and task_id in self.task_states:
-                logger.info(f"Task '{task.description[:30]}...' completed")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Task '%s...' completed", task.description[:30])
                 
                 # Update task status
                 self.task_states[task_id]["status"] = "completed"
@@ -385,17 +577,16 @@ class CrewVisualizationListener(BaseEventListener):
                     telemetry_service.end_task_execution(
                         crew_id=crew_id,
                         task_id=task_id,
-                        output=event.output if hasattr(event, "output") else None
+                        output=getattr(event, "output", None)
                     )
                 
                 # Broadcast the update asynchronously
                 # Schedule the broadcast on the main event loop
-            if hasattr(self, "loop"):
-                asyncio.run_coroutine_threadsafe(self.broadcast_update(), self.loop)
+                self._mark_dirty()
         
         @crewai_event_bus.on(CrewKickoffCompletedEvent)
         def on_crew_kickoff_completed(source, event):
-            logger.info(f"Crew '{event.crew_name}' execution completed")
+            logger.info("Crew '%s' execution completed", event.crew_name)
 
             output_text = event.output.raw if hasattr(event.output, 'raw') else str(event.output)
             
@@ -405,10 +596,10 @@ class CrewVisualizationListener(BaseEventListener):
             self.crew_state["output"] = output_text
             
             # Get crew ID - first try from source, then from state
-            crew_id = str(source.id) if hasattr(source, "id") else self.crew_state.get("id")
+            crew_id = _object_id(source) or self.crew_state.get("id")
             
             # Log the crew ID for debugging
-            logger.info(f"CrewKickoffCompletedEvent - Using crew_id: {crew_id}")
+            logger.info("CrewKickoffCompletedEvent - Using crew_id: %s", crew_id)
             
             if crew_id:
                 # Record in telemetry
@@ -426,8 +617,7 @@ class CrewVisualizationListener(BaseEventListener):
             
             # Broadcast the update asynchronously
             # Schedule the broadcast on the main event loop
-            if hasattr(self, "loop"):
-                asyncio.run_coroutine_threadsafe(self.broadcast_update(), self.loop)
+            self._mark_dirty()
 
 # Add handlers for LLM call events
         
@@ -439,12 +629,10 @@ class CrewVisualizationListener(BaseEventListener):
                 return
             
             # Get the agent ID if available
-            agent_id = None
-            if hasattr(event, "agent") and event.agent:
-                agent_id = str(event.agent.id) if hasattr(event.agent, "id") else None
+            agent_id = _object_id(getattr(event, "agent", None))
             
             # Log the event
-            logger.info(f"LLM call started")
+            logger.info("LLM call started")
             
             # Add an event to telemetry
             telemetry_service.add_event(
@@ -452,8 +640,8 @@ class CrewVisualizationListener(BaseEventListener):
                 event_type="llm.started",
                 event_data={
                     "agent_id": agent_id,
-                    "prompt": event.prompt if hasattr(event, "prompt") else "",
-                    "timestamp": datetime.utcnow().isoformat()
+                    "prompt": getattr(event, "prompt", ""),
+                    "timestamp": datetime.utcnow()
                 }
             )
         
@@ -465,12 +653,10 @@ class CrewVisualizationListener(BaseEventListener):
                 return
             
             # Get the agent ID if available
-            agent_id = None
-            if hasattr(event, "agent") and event.agent:
-                agent_id = str(event.agent.id) if hasattr(event.agent, "id") else None
+            agent_id = _object_id(getattr(event, "agent", None))
             
             # Log the event
-            logger.info(f"LLM call completed")
+            logger.info("LLM call completed")
             
             # Add an event to telemetry
             telemetry_service.add_event(
@@ -478,8 +664,8 @@ class CrewVisualizationListener(BaseEventListener):
                 event_type="llm.completed",
                 event_data={
                     "agent_id": agent_id,
-                    "response": event.response if hasattr(event, "response") else "",
-                    "timestamp": datetime.utcnow().isoformat()
+                    "response": getattr(event, "response", ""),
+                    "timestamp": datetime.utcnow()
                 }
             )
 
@@ -8,14 +8,18 @@ the user's environment, similar to how crews are discovered.
 import os
 import sys
 import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 import inspect
 from typing import Dict, List, Any, Optional, Tuple, Union
 import logging
 import uuid
+from pathlib import Path
 from pydantic import BaseModel
 import ast
 import re
 
+from crewai_chat_ui.crew_loader import walk_python_files
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -23,6 +27,12 @@ logger = logging.getLogger(__name__)
 # Set this module's logger to a higher level to reduce noise
 logger.setLevel(logging.WARNING)
 
+# Source-level signs of a Flow: a class named or derived from *Flow, or flow decorators
+_FLOW_INDICATOR_RE = re.compile(r"Flow\b|@(?:start|listen|router|persist)\b")
+
+# extract_flows_from_file results per file path, with the (mtime, size) they were read at
+_flow_file_cache: Dict[str, Tuple[Tuple[int, int], List["FlowInfo"]]] = {}
+
 
 class FlowInput(BaseModel):
     """Model for flow input parameters"""
@@ -80,36 +90,28 @@ def discover_flows(directory: str = None) -> List[FlowInfo]:
 
     flows = []
 
-    # Walk through the directory
-    for root, _, files in os.walk(directory):
-        # Skip __pycache__ directories and common virtual environment directories
-        if any(
-            skip_dir in root
-            for skip_dir in [
-                "__pycache__",
-                ".venv",
-                "venv",
-                "site-packages",
-                ".git",
-                "node_modules",
-            ]
-        ):
-            continue
-
-        # Look for Python files
-        for file in files:
-            if not file.endswith(".py"):
-                continue
+    # Same pruned walk as crew discovery, skipping virtual environments and caches
+    python_files = [entry.path for entry in walk_python_files(Path(directory))]
 
-            file_path = os.path.join(root, file)
+    # Reading and prescanning files is I/O bound, so overlap it across threads;
+    # importing the remaining candidates mutates sys.path and stays sequential
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        candidates = [
+            file_path
+            for file_path, may_contain_flows in zip(
+                python_files, executor.map(_may_contain_flows, python_files)
+            )
+            if may_contain_flows
+        ]
 
-            try:
-                # Extract flow classes from the file
-                file_flows = extract_flows_from_file(file_path)
-                flows.extend(file_flows)
-            except Exception as e:
-                # Log at debug level instead of error for non-flow files
-                logger.debug(f"Error processing file {file_path}: {str(e)}")
+    for file_path in candidates:
+        try:
+            # Extract flow classes from the file
+            file_flows = extract_flows_from_file(file_path)
+            flows.extend(file_flows)
+        except Exception as e:
+            # Log at debug level instead of error for non-flow files
+            logger.debug(f"Error processing file {file_path}: {str(e)}")
 
     logger.info(f"Discovered {len(flows)} flows")
     return flows
@@ -125,15 +127,28 @@ def extract_flows_from_file(file_path: str) -> List[FlowInfo]:
     Returns:
         List of FlowInfo objects for flows found in the file
     """
+    # Reuse an earlier result if the file hasn't changed since
+    try:
+        stat = os.stat(file_path)
+        file_signature = (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        return []
+    cached = _flow_file_cache.get(file_path)
+    if cached is not None and cached[0] == file_signature:
+        return list(cached[1])
+
     flows = []
+    # Set once the module executes, so its result (even an empty one) can be cached
+    imported = False
 
     try:
         # First, try to parse the file with AST to check for Flow classes
         with open(file_path, "r", encoding="utf-8") as f:
             content = f.read()
 
-        # Quick check if this file might contain flows
+        # Quick check if this file might contain flows, without importing it
         if not _contains_flow_indicators(content):
+            _flow_file_cache[file_path] = (file_signature, [])
             return []
 
         # Generate a random module name to avoid conflicts
@@ -226,13 +241,15 @@ def extract_flows_from_file(file_path: str) -> List[FlowInfo]:
                     del sys.modules[module_name]
                 return []
 
-            # Inspect all classes in the module
-            for name, obj in inspect.getmembers(module):
+            imported = True
+
+            # Inspect the classes defined in the module, reading its namespace
+            # directly rather than through getattr on every dir() entry
+            for name, obj in list(vars(module).items()):
                 # Check if it's a class and potentially a Flow
                 if (
-                    inspect.isclass(obj)
+                    isinstance(obj, type)
                     and name != "Flow"  # Skip the base Flow class
-                    and hasattr(obj, "__module__")
                     and obj.__module__ == module_name
                 ):
 
@@ -267,7 +284,43 @@ def extract_flows_from_file(file_path: str) -> List[FlowInfo]:
         # Other errors at debug level too
         logger.debug(f"Error extracting flows from {file_path}: {str(e)}")
 
-    return flows
+    # Files that failed to import aren't cached so they're retried next time
+    if imported:
+        _flow_file_cache[file_path] = (file_signature, flows)
+    return list(flows)
+
+
+def _may_contain_flows(file_path: str) -> bool:
+    """
+    Cheaply check whether a file could define flows, without importing it.
+
+    Args:
+        file_path: Path to the Python file
+
+    Returns:
+        False if the file certainly has no flows, True otherwise
+    """
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return False
+    file_signature = (stat.st_mtime_ns, stat.st_size)
+
+    cached = _flow_file_cache.get(file_path)
+    if cached is not None and cached[0] == file_signature:
+        return bool(cached[1])
+
+    try:
+        with open(file_path, "r", encoding="utf-8") as f:
+            content = f.read()
+    except (OSError, UnicodeDecodeError):
+        return False
+
+    if _contains_flow_indicators(content):
+        return True
+
+    _flow_file_cache[file_path] = (file_signature, [])
+    return False
 
 
 def _contains_flow_indicators(content: str) -> bool:
@@ -280,19 +333,7 @@ def _contains_flow_indicators(content: str) -> bool:
     Returns:
         True if file might contain flows, False otherwise
     """
-    indicators = [
-        "from crewai",
-        "import crewai",
-        "Flow",
-        "@start",
-        "@listen",
-        "@router",
-        "@persist",
-        "kickoff",
-    ]
-
-    content_lower = content.lower()
-    return any(indicator.lower() in content_lower for indicator in indicators)
+    return _FLOW_INDICATOR_RE.search(content) is not None
 
 
 def _is_flow_class(obj) -> bool:
@@ -0,0 +1,88 @@
+"""
+JSON File Cache for CrewAI Chat UI
+
+This module provides a small persistent key/value cache stored as a single
+JSON file, used to keep deterministic LLM-derived results across restarts.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# Per-user cache directory for results that are expensive to recompute
+CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "crewai_chat_ui"
+)
+
+
+def cache_key(*parts: Any) -> str:
+    """Build a stable cache key from JSON-serializable parts.
+
+    Args:
+        *parts: Values that together identify the cached result
+
+    Returns:
+        Hex SHA-256 digest of the serialized parts
+    """
+    serialized = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+class JsonFileCache:
+    """Least-recently-stored cache of JSON values persisted to one file.
+
+    The file is read lazily on first use and rewritten atomically on every
+    store. Failures to read or write are logged and otherwise ignored, since
+    the cache is only ever an optimization.
+    """
+
+    def __init__(self, path: Path, max_entries: int):
+        self.path = path
+        self.max_entries = max_entries
+        self._entries: Optional["OrderedDict[str, Any]"] = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> "OrderedDict[str, Any]":
+        """Return the in-memory entries, reading the file the first time."""
+        if self._entries is None:
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                self._entries = OrderedDict(data if isinstance(data, dict) else {})
+            except FileNotFoundError:
+                self._entries = OrderedDict()
+            except (OSError, ValueError) as e:
+                logger.debug("Ignoring unreadable cache file %s: %s", self.path, e)
+                self._entries = OrderedDict()
+        return self._entries
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for ``key``, or None if absent."""
+        with self._lock:
+            return self._load().get(key)
+
+    def set(self, key: str, value: Any) -> None:
+        """Store ``value`` under ``key``, evicting the oldest entries if full."""
+        with self._lock:
+            entries = self._load()
+            entries.pop(key, None)
+            entries[key] = value
+            while len(entries) > self.max_entries:
+                entries.popitem(last=False)
+
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                # Write then rename so concurrent readers never see a partial file
+                tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(entries, f)
+                os.replace(tmp_path, self.path)
+            except (OSError, TypeError) as e:
+                logger.debug("Could not write cache file %s: %s", self.path, e)
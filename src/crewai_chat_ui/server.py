@@ -8,17 +8,23 @@ from pathlib import Path
 import threading
 from typing import Dict, Optional, List, Any
 from fastapi import FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
-from fastapi.responses import JSONResponse, FileResponse, HTMLResponse
+from fastapi.responses import (
+    JSONResponse,
+    FileResponse,
+    HTMLResponse,
+    StreamingResponse,
+)
 from pydantic import BaseModel
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
 import click
+import httpx
+import litellm
 import socket
 import asyncio
 import importlib
 import inspect
-from crewai_chat_ui.tool_loader import discover_available_tools
 
 # Configure logging
 logging.basicConfig(
@@ -47,6 +53,23 @@ except ImportError:
     # python-dotenv not installed; proceed without loading
     pass
 
+# Serialize hot-path responses with orjson when it's installed
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse as FastJSONResponse
+
+    def _dumps_json(content: Any) -> str:
+        """Encode content with the same orjson options as FastJSONResponse."""
+        return orjson.dumps(
+            content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        ).decode()
+except ImportError:
+    FastJSONResponse = JSONResponse
+
+    def _dumps_json(content: Any) -> str:
+        """Encode content the same way as JSONResponse."""
+        return json.dumps(content, ensure_ascii=False, separators=(",", ":"))
+
 from crewai_chat_ui.crew_loader import (
     load_crew,
     load_crew_from_module,
@@ -54,7 +77,7 @@ from crewai_chat_ui.crew_loader import (
 )
 from crewai_chat_ui.chat_handler import ChatHandler
 from crewai_chat_ui.event_listener import crew_visualization_listener
-from crewai_chat_ui.tool_loader import discover_available_tools as discover_tools
+from crewai_chat_ui.tool_loader import discover_available_tools
 from crewai_chat_ui.telemetry import telemetry_service
 from crewai_chat_ui.flow_api import router as flow_router, get_active_execution
 
@@ -124,6 +147,8 @@ class ChatMessage(BaseModel):
     message: str
     crew_id: Optional[str] = None
     chat_id: Optional[str] = None
+    # Per-message override of the CREWAI_CHAT_RESPONSE_CACHE setting
+    cache: Optional[bool] = None
 
 
 class InitializeRequest(BaseModel):
@@ -139,138 +164,178 @@ class ToolExecuteRequest(BaseModel):
     inputs: Optional[Dict[str, str]] = None
 
 
-@app.post("/api/chat")
-async def chat(message: ChatMessage) -> JSONResponse:
-    """API endpoint to handle chat messages."""
+def _select_chat_handler(message: ChatMessage) -> ChatHandler:
+    """Validate a chat request and return the handler that should process it."""
     global chat_handler
 
-    user_message = message.message
-    crew_id = message.crew_id
-    chat_id = message.chat_id
-    logging.debug(f"Received chat message for chat_id: {chat_id}, crew_id: {crew_id}")
-
-    if not user_message:
+    if not message.message:
         logging.warning("No message provided in request")
         raise HTTPException(status_code=400, detail="No message provided")
 
-    try:
-        # If no chat_id is provided, we can't properly track the thread
-        if not chat_id:
-            raise HTTPException(
-                status_code=400,
-                detail="No chat ID provided. Unable to track conversation thread.",
-            )
+    # If no chat_id is provided, we can't properly track the thread
+    if not message.chat_id:
+        raise HTTPException(
+            status_code=400,
+            detail="No chat ID provided. Unable to track conversation thread.",
+        )
 
-        # If a specific crew_id is provided, use that chat handler
-        if crew_id and crew_id in chat_handlers:
-            handler = chat_handlers[crew_id]
-            # Update the global chat handler to track the currently active one
-            chat_handler = handler
-        elif chat_handler is None:
-            raise HTTPException(
-                status_code=400,
-                detail="No crew has been initialized. Please select a crew first.",
-            )
+    # If a specific crew_id is provided, use that chat handler
+    if message.crew_id and message.crew_id in chat_handlers:
+        # Update the global chat handler to track the currently active one
+        chat_handler = chat_handlers[message.crew_id]
+    elif chat_handler is None:
+        raise HTTPException(
+            status_code=400,
+            detail="No crew has been initialized. Please select a crew first.",
+        )
 
-        # Always store messages in the appropriate chat thread
-        # Initialize the thread if it doesn't exist
-        if chat_id not in chat_threads:
-            chat_threads[chat_id] = {"crew_id": crew_id, "messages": []}
-            logging.debug(f"Created new chat thread for chat_id: {chat_id}")
+    return chat_handler
 
-        # Add user message to the thread
-        chat_threads[chat_id]["messages"].append(
-            {"role": "user", "content": user_message}
-        )
-        logging.debug(
-            f"Added user message to chat_id: {chat_id}, message count: {len(chat_threads[chat_id]['messages'])}"
-        )
 
-        # Always restore the conversation history for this thread
-        if hasattr(chat_handler, "messages"):
-            # Save the current thread first if it exists and is different
-            current_thread = getattr(chat_handler, "current_chat_id", None)
-            if (
-                current_thread
-                and current_thread != chat_id
-                and hasattr(chat_handler, "messages")
-            ):
-                # Create a deep copy of the messages to avoid reference issues
-                chat_threads[current_thread] = {
-                    "crew_id": (
-                        crew_id
-                        if crew_id
-                        else getattr(chat_handler, "crew_name", "default")
-                    ),
-                    "messages": (
-                        chat_handler.messages.copy()
-                        if isinstance(chat_handler.messages, list)
-                        else []
-                    ),
-                }
-                logging.debug(
-                    f"Saved {len(chat_handler.messages)} messages from previous thread: {current_thread}"
-                )
+def _record_user_message(chat_id: str, crew_id: Optional[str], user_message: str):
+    """Add the user's message to its chat thread, creating the thread if needed."""
+    if chat_id not in chat_threads:
+        chat_threads[chat_id] = {"crew_id": crew_id, "messages": []}
+        logging.debug(f"Created new chat thread for chat_id: {chat_id}")
 
-            # Restore the thread we're working with - create a deep copy to avoid reference issues
-            if chat_id in chat_threads:
-                chat_handler.messages = (
-                    chat_threads[chat_id]["messages"].copy()
-                    if isinstance(chat_threads[chat_id]["messages"], list)
-                    else []
-                )
-                # Mark the current thread
-                chat_handler.current_chat_id = chat_id
-                logging.debug(
-                    f"Restored {len(chat_handler.messages)} messages for chat_id: {chat_id}"
-                )
+    chat_threads[chat_id]["messages"].append({"role": "user", "content": user_message})
+    logging.debug(
+        f"Added user message to chat_id: {chat_id}, message count: {len(chat_threads[chat_id]['messages'])}"
+    )
 
-        logging.debug(f"Processing message with chat_handler for chat_id: {chat_id}")
-        response = chat_handler.process_message(user_message)
 
-        # Ensure we have content in the response
-        if not response.get("content") and response.get("status") == "success":
-            logging.warning("Response content is empty despite successful status")
-            response["content"] = (
-                "I'm sorry, but I couldn't generate a response. Please try again."
-            )
+def _restore_chat_thread(handler: ChatHandler, chat_id: str, crew_id: Optional[str]):
+    """Swap the handler's message history over to the given chat thread.
 
-        # Always add the response to the chat thread if it's valid
-        if response.get("status") == "success" and response.get("content"):
-            # Add the assistant response to the chat thread
-            chat_threads[chat_id]["messages"].append(
-                {"role": "assistant", "content": response["content"]}
-            )
+    Must be called while holding ``handler.lock``.
+    """
+    # Save the current thread first if it exists and is different
+    current_thread = getattr(handler, "current_chat_id", None)
+    if current_thread and current_thread != chat_id:
+        # Create a deep copy of the messages to avoid reference issues
+        chat_threads[current_thread] = {
+            "crew_id": (crew_id if crew_id else getattr(handler, "crew_name", "default")),
+            "messages": (
+                handler.messages.copy() if isinstance(handler.messages, list) else []
+            ),
+        }
+        logging.debug(
+            f"Saved {len(handler.messages)} messages from previous thread: {current_thread}"
+        )
 
-            # Ensure chat_handler.messages is synchronized with chat_threads
-            # This is critical to ensure messages are preserved correctly
-            if hasattr(chat_handler, "messages"):
-                # Synchronize the chat handler's messages with the thread
-                chat_handler.messages = chat_threads[chat_id]["messages"].copy()
+    # Restore the thread we're working with - create a deep copy to avoid reference issues
+    if chat_id in chat_threads:
+        handler.messages = (
+            chat_threads[chat_id]["messages"].copy()
+            if isinstance(chat_threads[chat_id]["messages"], list)
+            else []
+        )
+        # Mark the current thread
+        handler.current_chat_id = chat_id
+        logging.debug(f"Restored {len(handler.messages)} messages for chat_id: {chat_id}")
 
-            logging.debug(
-                f"Added assistant response to chat_id: {chat_id}, message count: {len(chat_threads[chat_id]['messages'])}"
-            )
 
-        # Always include the chat_id in the response to ensure proper thread tracking
-        response["chat_id"] = chat_id
-        response["crew_id"] = (
-            crew_id if crew_id else getattr(chat_handler, "crew_name", "default")
+def _record_chat_response(
+    handler: ChatHandler,
+    chat_id: str,
+    crew_id: Optional[str],
+    response: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Store a processed response in its chat thread and annotate it for the client.
+
+    Must be called while holding ``handler.lock``.
+    """
+    # Ensure we have content in the response
+    if not response.get("content") and response.get("status") == "success":
+        logging.warning("Response content is empty despite successful status")
+        response["content"] = (
+            "I'm sorry, but I couldn't generate a response. Please try again."
         )
+
+    # Always add the response to the chat thread if it's valid
+    if response.get("status") == "success" and response.get("content"):
+        # Add the assistant response to the chat thread
+        chat_threads[chat_id]["messages"].append(
+            {"role": "assistant", "content": response["content"]}
+        )
+
+        # Ensure handler.messages is synchronized with chat_threads
+        # This is critical to ensure messages are preserved correctly
+        handler.messages = chat_threads[chat_id]["messages"].copy()
+
         logging.debug(
-            f"Sending response for chat_id: {chat_id}, crew_id: {response['crew_id']}"
+            f"Added assistant response to chat_id: {chat_id}, message count: {len(chat_threads[chat_id]['messages'])}"
         )
 
-        return JSONResponse(content=response)
+    # Always include the chat_id in the response to ensure proper thread tracking
+    response["chat_id"] = chat_id
+    response["crew_id"] = crew_id if crew_id else getattr(handler, "crew_name", "default")
+    logging.debug(
+        f"Sending response for chat_id: {chat_id}, crew_id: {response['crew_id']}"
+    )
+    return response
+
+
+@app.post("/api/chat")
+async def chat(message: ChatMessage) -> FastJSONResponse:
+    """API endpoint to handle chat messages."""
+    chat_id = message.chat_id
+    crew_id = message.crew_id
+    logging.debug(f"Received chat message for chat_id: {chat_id}, crew_id: {crew_id}")
+
+    try:
+        # Keep a local reference so concurrent requests can't swap it mid-turn
+        handler = _select_chat_handler(message)
+        _record_user_message(chat_id, crew_id, message.message)
+
+        # Turns on the same handler share its message history, so run them one at a time
+        async with handler.lock:
+            _restore_chat_thread(handler, chat_id, crew_id)
+
+            logging.debug(f"Processing message with chat_handler for chat_id: {chat_id}")
+            response = await handler.aprocess_message(message.message, message.cache)
+
+            response = _record_chat_response(handler, chat_id, crew_id, response)
+
+        return FastJSONResponse(content=response)
+    except HTTPException:
+        raise
     except Exception as e:
         error_message = f"Error processing chat message: {str(e)}"
         logging.error(error_message, exc_info=True)
         raise HTTPException(status_code=500, detail=error_message)
 
 
+@app.post("/api/chat/stream")
+async def chat_stream(message: ChatMessage) -> StreamingResponse:
+    """API endpoint that streams the response to a chat message as server-sent events.
+
+    Each event is a JSON object with a ``type`` of ``content`` (a text delta),
+    ``tool`` (the crew is running; content that follows replaces earlier text)
+    or ``done`` (the complete response, in the same shape as ``/api/chat``).
+    """
+    chat_id = message.chat_id
+    crew_id = message.crew_id
+    logging.debug(f"Received streaming chat message for chat_id: {chat_id}, crew_id: {crew_id}")
+
+    handler = _select_chat_handler(message)
+    _record_user_message(chat_id, crew_id, message.message)
+
+    async def event_stream():
+        async with handler.lock:
+            _restore_chat_thread(handler, chat_id, crew_id)
+
+            async for event in handler.stream_message(message.message, message.cache):
+                if event["type"] == "done":
+                    event = _record_chat_response(handler, chat_id, crew_id, event)
+                yield f"data: {_dumps_json(event)}\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
 @app.post("/api/initialize")
 @app.get("/api/initialize")
-async def initialize(request: InitializeRequest = None) -> JSONResponse:
+async def initialize(request: InitializeRequest = None) -> FastJSONResponse:
     """Initialize the chat handler and return initial message."""
     global chat_handler
 
@@ -323,51 +388,54 @@ async def initialize(request: InitializeRequest = None) -> JSONResponse:
                 crew_instance, crew_name = load_crew()
                 chat_handler = ChatHandler(crew_instance, crew_name)
 
-        # Initialize the chat handler
-        initial_message = chat_handler.initialize()
-
-        # If a chat_id is provided, associate it with this chat handler
-        if chat_id:
-            # Set the current chat ID for this handler
-            chat_handler.current_chat_id = chat_id
-
-            # If this chat thread already exists, restore its messages
-            if chat_id in chat_threads:
-                # Only restore if the crew matches
-                if chat_threads[chat_id]["crew_id"] == crew_id:
-                    # Create a deep copy of the messages to avoid reference issues
-                    chat_handler.messages = (
-                        chat_threads[chat_id]["messages"].copy()
-                        if isinstance(chat_threads[chat_id]["messages"], list)
-                        else []
-                    )
-                    logging.debug(
-                        f"Restored {len(chat_handler.messages)} messages for chat_id: {chat_id}"
-                    )
+        # Keep a local reference so concurrent requests can't swap it while we wait
+        handler = chat_handler
+
+        # Hold the handler's lock so concurrent initializes don't both make the
+        # intro LLM call and in-flight turns don't see their history replaced
+        async with handler.lock:
+            # Initialize the chat handler off the event loop; this makes an LLM call
+            initial_message = await asyncio.to_thread(handler.initialize)
+
+            # If a chat_id is provided, associate it with this chat handler
+            if chat_id:
+                # Set the current chat ID for this handler
+                handler.current_chat_id = chat_id
+
+                # If this chat thread already exists, restore its messages
+                if chat_id in chat_threads:
+                    # Only restore if the crew matches
+                    if chat_threads[chat_id]["crew_id"] == crew_id:
+                        # Create a deep copy of the messages to avoid reference issues
+                        handler.messages = (
+                            chat_threads[chat_id]["messages"].copy()
+                            if isinstance(chat_threads[chat_id]["messages"], list)
+                            else []
+                        )
+                        logging.debug(
+                            f"Restored {len(handler.messages)} messages for chat_id: {chat_id}"
+                        )
+                    else:
+                        # If crew doesn't match, create a new thread with the same ID but different crew
+                        chat_threads[chat_id] = {"crew_id": crew_id, "messages": []}
+                        handler.messages = []
+                        logging.debug(
+                            f"Created new chat thread for chat_id: {chat_id} with different crew"
+                        )
                 else:
-                    # If crew doesn't match, create a new thread with the same ID but different crew
+                    # Initialize a new chat thread
                     chat_threads[chat_id] = {"crew_id": crew_id, "messages": []}
-                    chat_handler.messages = []
-                    logging.debug(
-                        f"Created new chat thread for chat_id: {chat_id} with different crew"
-                    )
-            else:
-                # Initialize a new chat thread
-                chat_threads[chat_id] = {"crew_id": crew_id, "messages": []}
-                chat_handler.messages = []
-                logging.debug(f"Created new chat thread for chat_id: {chat_id}")
+                    handler.messages = []
+                    logging.debug(f"Created new chat thread for chat_id: {chat_id}")
 
-        return JSONResponse(
+        return FastJSONResponse(
             content={
                 "status": "success",
                 "message": initial_message,
-                "required_inputs": [
-                    {"name": field.name, "description": field.description}
-                    for field in chat_handler.crew_chat_inputs.inputs
-                ],
-                "crew_id": crew_id or chat_handler.crew_name,
-                "crew_name": chat_handler.crew_name,
-                "crew_description": chat_handler.crew_chat_inputs.crew_description,
+                "required_inputs": handler.required_inputs,
+                "crew_id": crew_id or handler.crew_name,
+                "crew_name": handler.crew_name,
+                "crew_description": handler.crew_chat_inputs.crew_description,
                 "chat_id": chat_id,
             }
         )
@@ -772,10 +840,24 @@ def show_loading(stop_event, message):
         dots = "." * (counter % 4)
         click.echo(f"\r{message}{dots.ljust(3)}", nl=False)
         counter += 1
-        threading.Event().wait(0.5)
+        stop_event.wait(0.5)
     click.echo()  # Final newline
 
 
+def share_llm_connection_pool(max_connections: int = 32):
+    """Route all litellm requests through shared keep-alive HTTP clients.
+
+    Without this each provider client opens its own connections, so TCP and
+    TLS handshakes are repeated instead of being amortized across chat turns.
+    """
+    limits = httpx.Limits(
+        max_connections=max_connections, max_keepalive_connections=max_connections
+    )
+    timeout = httpx.Timeout(600.0, connect=10.0)
+    litellm.client_session = httpx.Client(limits=limits, timeout=timeout)
+    litellm.aclient_session = httpx.AsyncClient(limits=limits, timeout=timeout)
+
+
 def find_available_port(start_port: int = 8000, max_attempts: int = 100) -> int:
     """Find the next available port starting from start_port."""
     for port in range(start_port, start_port + max_attempts):
@@ -790,7 +872,26 @@ def find_available_port(start_port: int = 8000, max_attempts: int = 100) -> int:
     )
 
 
-def main():
+@click.command()
+@click.option(
+    "--host",
+    default="0.0.0.0",
+    show_default=True,
+    help="Interface to listen on.",
+)
+@click.option(
+    "--port",
+    default=8000,
+    show_default=True,
+    help="Preferred port; the next free port is used if it's taken.",
+)
+@click.option(
+    "--keep-alive",
+    default=30,
+    show_default=True,
+    help="Seconds to keep idle HTTP connections open for reuse.",
+)
+def main(host: str, port: int, keep_alive: int):
     """Main entry point for the CLI."""
     global chat_handler, discovered_crews
 
@@ -800,12 +901,18 @@ def main():
         # Try to discover all crews in the current directory
         click.echo("Discovering crews in current directory...")
 
-        # Show loading indicator for crew loading
+        # Only animate the loading indicator on an interactive terminal
         stop_loading = threading.Event()
-        loading_thread = threading.Thread(
-            target=show_loading, args=(stop_loading, "Searching for crew files")
-        )
-        loading_thread.start()
+        loading_thread = None
+        if sys.stdout.isatty():
+            loading_thread = threading.Thread(
+                target=show_loading,
+                args=(stop_loading, "Searching for crew files"),
+                daemon=True,
+            )
+            loading_thread.start()
+        else:
+            click.echo("Searching for crew files...")
 
         try:
             # Discover all available crews
@@ -818,7 +925,8 @@ def main():
             discovered_crews = crews_info
 
             stop_loading.set()
-            loading_thread.join()
+            if loading_thread:
+                loading_thread.join()
 
             if crews_info:
                 click.echo(f"Found {len(crews_info)} crews:")
@@ -871,13 +979,20 @@ def main():
                     sys.exit(1)
         except Exception as e:
             stop_loading.set()
-            loading_thread.join()
+            if loading_thread:
+                loading_thread.join()
             click.echo(f"Error discovering crews: {str(e)}", err=True)
             sys.exit(1)
 
+        share_llm_connection_pool()
+
+        # Analyze the default crew now so the first chat request doesn't pay for it
+        if chat_handler is not None:
+            click.echo(f"Preparing {chat_handler.crew_name}...")
+            chat_handler.initialize()
+
         # Start the FastAPI server with uvicorn
-        host = "0.0.0.0"  # Listen on all interfaces
-        default_port = 8000
+        default_port = port
 
         try:
             port = find_available_port(default_port)
@@ -899,7 +1014,21 @@ def main():
         click.echo(click.style("Press Ctrl+C to stop the server", fg="yellow"))
 
         # Run the FastAPI app with uvicorn
-        uvicorn.run(app, host=host, port=port, log_level="error")
+        # A single process is used on purpose: chat threads, handlers and
+        # WebSocket clients are held in memory and can't be shared across workers.
+        # loop="auto" uses uvloop when the speedups extra is installed.
+        # Per-message deflate is off: broadcasts send the same payload to every
+        # client, and compressing it again for each connection costs more CPU
+        # than it saves on a local connection.
+        uvicorn.run(
+            app,
+            host=host,
+            port=port,
+            log_level="error",
+            timeout_keep_alive=keep_alive,
+            loop="auto",
+            ws_per_message_deflate=False,
+        )
 
     except KeyboardInterrupt:
         click.echo("\nServer stopped")
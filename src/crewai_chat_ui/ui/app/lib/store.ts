@@ -48,6 +48,7 @@ interface ChatState {
   setCurrentCrew: (crewId: string | null) => void
   setCurrentChat: (chatId: string | null) => void
   addMessage: (chatId: string, message: ChatMessage) => void
+  updateLastMessage: (chatId: string, content: string) => void
   createChat: (chatId: string, crewId: string | null, title?: string) => void
   deleteChat: (chatId: string) => void
   toggleDarkMode: () => void
@@ -93,6 +94,29 @@ export const useChatStore = create<ChatState>()(
           }
         }),
 
+      updateLastMessage: (chatId, content) =>
+        set((state) => {
+          const chat = state.chatHistory[chatId]
+          if (!chat || chat.messages.length === 0) return state
+
+          const messages = chat.messages.slice()
+          messages[messages.length - 1] = {
+            ...messages[messages.length - 1],
+            content,
+          }
+
+          return {
+            chatHistory: {
+              ...state.chatHistory,
+              [chatId]: {
+                ...chat,
+                messages,
+                lastUpdated: Date.now(),
+              },
+            },
+          }
+        }),
+
       createChat: (chatId, crewId, title = 'New Chat') =>
         set((state) => {
           // Check if chat already exists to avoid overwriting
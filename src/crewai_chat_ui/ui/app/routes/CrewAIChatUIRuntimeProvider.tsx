@@ -89,7 +89,7 @@ export function CrewAIChatUIRuntimeProvider({
     setIsRunning(true);
     
     try {
-      const response = await fetch("/api/chat", {
+      const response = await fetch("/api/chat/stream", {
         method: "POST",
         headers: {
           "Content-Type": "application/json",
@@ -101,20 +101,56 @@ export function CrewAIChatUIRuntimeProvider({
         }),
       });
 
-      if (!response.ok) {
+      if (!response.ok || !response.body) {
         throw new Error(`API request failed with status ${response.status}`);
       }
 
-      const data = await response.json();
-      
-      if (data.status === "success" && data.content) {
-        addMessage(currentChatId, {
-          role: 'assistant',
-          content: data.content,
-          timestamp: Date.now(),
-        });
-      } else {
-        throw new Error(data.message || "Unknown error occurred");
+      const { updateLastMessage } = useChatStore.getState();
+      const reader = response.body.getReader();
+      const decoder = new TextDecoder();
+      let buffer = "";
+      let streamedContent = "";
+      let hasAssistantMessage = false;
+
+      const showContent = (content: string) => {
+        if (hasAssistantMessage) {
+          updateLastMessage(currentChatId, content);
+        } else {
+          addMessage(currentChatId, {
+            role: 'assistant',
+            content,
+            timestamp: Date.now(),
+          });
+          hasAssistantMessage = true;
+        }
+      };
+
+      while (true) {
+        const { done, value } = await reader.read();
+        if (done) break;
+
+        buffer += decoder.decode(value, { stream: true });
+        const frames = buffer.split("\n\n");
+        buffer = frames.pop() ?? "";
+
+        for (const frame of frames) {
+          if (!frame.startsWith("data: ")) continue;
+          const data = JSON.parse(frame.slice("data: ".length));
+
+          if (data.type === "content") {
+            streamedContent += data.content;
+            showContent(streamedContent);
+          } else if (data.type === "tool") {
+            // The crew is running; the summary that follows replaces this text
+            streamedContent = "";
+          } else if (data.type === "done") {
+            if (data.status === "success" && data.content) {
+              showContent(data.content);
+            } else {
+              throw new Error(data.content || "Unknown error occurred");
+            }
+          }
+        }
       }
     } catch (error) {
       console.error("Error in chat:", error);